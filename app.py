@@ -15,15 +15,27 @@ import json
 import time
 import logging
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Optional
 from flask import Flask, render_template, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_socketio import SocketIO, emit
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logging.warning("orjson not available - using standard json encoder")
+
 import config
 from mount_client import get_mount_client
 from camera_client import get_camera_client
-from plate_solver import get_plate_solver
+from plate_solver import SolveResult, get_plate_solver
 from pa_calculator import (
-    calculate_pa_error, calculate_correction,
+    PAError, calculate_pa_error, calculate_correction,
     parse_ra_string, parse_dec_string
 )
 
@@ -34,16 +46,118 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    *****
+    Purpose: Flask JSON provider backed by orjson for faster API responses
+
+    Parameters:
+    Flask app: Application the provider is attached to
+
+    Returns:
+    OrjsonProvider instance
+    *****
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        # Solver and PA maths can hand back NumPy scalars, which the stdlib
+        # encoder accepted but orjson only serializes with this option
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+class OrjsonSocketCodec:
+    """
+    *****
+    Purpose: json-module-compatible orjson shim for Socket.IO packet encoding
+
+    Parameters:
+    None
+
+    Returns:
+    OrjsonSocketCodec class (used via its static methods)
+    *****
+    """
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
+
+
 # Create Flask app
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'oat-pa-secret-key'
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='gevent')
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
+    socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading', json=OrjsonSocketCodec)
+else:
+    socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
 
 # Global state
-alignment_running = False
 alignment_thread = None
-last_pa_error = None
-last_solve_result = None
+
+
+@dataclass(frozen=True)
+class AlignState:
+    """
+    *****
+    Purpose: Immutable snapshot of alignment state shared between the align thread and request handlers
+
+    The snapshot is replaced as a whole under _state_lock, so readers take
+    a single reference and never see a half-updated state.
+
+    Parameters:
+    bool running: Whether the auto-align loop is active
+    PAError pa_error: Latest PA error, or None
+    SolveResult solve: Latest plate solve, or None
+    dict pa_error_status: Preformatted JSON fragment for pa_error
+    dict solve_status: Preformatted JSON fragment for solve
+
+    Returns:
+    AlignState instance
+    *****
+    """
+    running: bool = False
+    pa_error: Optional[PAError] = None
+    solve: Optional[SolveResult] = None
+    # Preformatted fragments, rebuilt only when the underlying result changes
+    # so status polls do not re-run the RA/DEC formatters every time
+    pa_error_status: Optional[dict] = None
+    solve_status: Optional[dict] = None
+
+
+_state = AlignState()
+_state_lock = threading.Lock()
+
+
+def update_state(**changes) -> AlignState:
+    """
+    *****
+    Purpose: Atomically replace the shared alignment state snapshot
+
+    Parameters:
+    changes: AlignState fields to change
+
+    Returns:
+    AlignState: The new snapshot
+    *****
+    """
+    global _state
+    with _state_lock:
+        _state = replace(_state, **changes)
+        return _state
 
 LOCATIONS_FILE = '/etc/oat-web-pa/locations.json'
 
@@ -93,6 +207,113 @@ def save_locations(locations: dict) -> bool:
         logger.error(f"Could not save locations file: {e}")
         return False
 
+_TYPE_NAMES = {float: 'a number', int: 'an integer'}
+
+def parse_fields(data: dict, **fields) -> dict:
+    """
+    *****
+    Purpose: Coerce numeric fields of a JSON request body in one place
+
+    Parameters:
+    dict data: Parsed JSON body
+    fields: name=(type, default) pairs; fields absent from data take the
+        default (converted to type unless it is None)
+
+    Returns:
+    dict: Mapping of field name to converted value
+
+    Errors:
+    Raises ValueError naming the first field that cannot be converted
+    *****
+    """
+    values = {}
+    for name, (cast, default) in fields.items():
+        raw = data[name] if name in data else default
+        if raw is None and name not in data:
+            values[name] = None
+            continue
+        try:
+            values[name] = cast(raw)
+        except (ValueError, TypeError):
+            raise ValueError(f"{name} must be {_TYPE_NAMES.get(cast, cast.__name__)}")
+    return values
+
+def _mtime_ns(path: str) -> Optional[int]:
+    """Return a file's modification time in ns, or None if it cannot be stat'ed."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def find_latest_capture() -> Optional[str]:
+    """
+    *****
+    Purpose: Find the most recent capture_*.png in the camera's capture directory
+
+    Uses os.scandir so each entry is stat'ed once through its DirEntry.
+
+    Parameters:
+    None
+
+    Returns:
+    str: Path to the newest capture, or None if there are none
+    *****
+    """
+    try:
+        with os.scandir(get_camera_client().capture_dir) as it:
+            newest = max(
+                (e for e in it if e.name.startswith('capture_') and e.name.endswith('.png')),
+                key=lambda e: e.stat().st_ctime_ns,
+                default=None
+            )
+    except OSError as e:
+        logger.error(f"Could not scan capture directory: {e}")
+        return None
+    return newest.path if newest else None
+
+def set_last_solve_result(result: SolveResult) -> dict:
+    """
+    *****
+    Purpose: Store the latest plate solve and its preformatted status fragment
+
+    Parameters:
+    SolveResult result: The solve result to publish
+
+    Returns:
+    dict: The preformatted status fragment
+    *****
+    """
+    solve_status = {
+        'ra': result.ra,
+        'dec': result.dec,
+        'ra_hms': result.ra_hms(),
+        'dec_dms': result.dec_dms(),
+        'solver': result.solver
+    }
+    update_state(solve=result, solve_status=solve_status)
+    return solve_status
+
+def set_last_pa_error(pa_error: PAError) -> dict:
+    """
+    *****
+    Purpose: Store the latest PA error and its preformatted status fragment
+
+    Parameters:
+    PAError pa_error: The PA error to publish
+
+    Returns:
+    dict: The preformatted status fragment
+    *****
+    """
+    pa_error_status = {
+        'az': pa_error.az_error,
+        'alt': pa_error.alt_error,
+        'total': pa_error.total_error,
+        'aligned': pa_error.is_aligned()
+    }
+    update_state(pa_error=pa_error, pa_error_status=pa_error_status)
+    return pa_error_status
+
 
 # ============================================================================
 # Routes - Pages
@@ -123,11 +344,12 @@ def api_status():
     """
     mount = get_mount_client()
     camera = get_camera_client()
+    snap = _state
 
     status = {
         'mount_connected': mount.connected,
         'camera_connected': camera.connected,
-        'alignment_running': alignment_running,
+        'alignment_running': snap.running,
         'target_accuracy': config.TARGET_ACCURACY,
     }
 
@@ -139,22 +361,11 @@ def api_status():
         status['slewing'] = mount.is_slewing()
         status['adjusting'] = mount.is_adjusting()
 
-    if last_pa_error:
-        status['pa_error'] = {
-            'az': last_pa_error.az_error,
-            'alt': last_pa_error.alt_error,
-            'total': last_pa_error.total_error,
-            'aligned': last_pa_error.is_aligned()
-        }
-
-    if last_solve_result:
-        status['last_solve'] = {
-            'ra': last_solve_result.ra,
-            'dec': last_solve_result.dec,
-            'ra_hms': last_solve_result.ra_hms(),
-            'dec_dms': last_solve_result.dec_dms(),
-            'solver': last_solve_result.solver
-        }
+    if snap.pa_error_status:
+        status['pa_error'] = snap.pa_error_status
+
+    if snap.solve_status:
+        status['last_solve'] = snap.solve_status
 
     return jsonify(status)
 
@@ -197,9 +408,7 @@ def api_connect():
 @app.route('/api/disconnect', methods=['POST'])
 def api_disconnect():
     """Disconnect from mount and camera."""
-    global alignment_running
-
-    alignment_running = False
+    update_state(running=False)
 
     mount = get_mount_client()
     camera = get_camera_client()
@@ -258,11 +467,10 @@ def api_slew_rate():
 @app.route('/api/move-az', methods=['POST'])
 def api_move_az():
     """Move azimuth by specified arcminutes."""
-    data = request.get_json() or {}
     try:
-        arcmin = float(data.get('arcmin', 0))
-    except (ValueError, TypeError):
-        return jsonify({'error': 'arcmin must be a number'}), 400
+        arcmin = parse_fields(request.get_json() or {}, arcmin=(float, 0))['arcmin']
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
 
     mount = get_mount_client()
     if not mount.connected:
@@ -275,11 +483,10 @@ def api_move_az():
 @app.route('/api/move-alt', methods=['POST'])
 def api_move_alt():
     """Move altitude by specified arcminutes."""
-    data = request.get_json() or {}
     try:
-        arcmin = float(data.get('arcmin', 0))
-    except (ValueError, TypeError):
-        return jsonify({'error': 'arcmin must be a number'}), 400
+        arcmin = parse_fields(request.get_json() or {}, arcmin=(float, 0))['arcmin']
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
 
     mount = get_mount_client()
     if not mount.connected:
@@ -318,18 +525,20 @@ def api_capture():
     JSON: Path to captured image
     *****
     """
-    data = request.get_json() or {}
     try:
-        exposure = float(data.get('exposure', config.DEFAULT_EXPOSURE))
-        gain = int(data.get('gain', config.DEFAULT_GAIN))
-    except (ValueError, TypeError):
-        return jsonify({'error': 'exposure must be a number; gain must be an integer'}), 400
+        req = parse_fields(
+            request.get_json() or {},
+            exposure=(float, config.DEFAULT_EXPOSURE),
+            gain=(int, config.DEFAULT_GAIN)
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
 
     camera = get_camera_client()
     if not camera.connected:
         return jsonify({'error': 'Camera not connected'}), 400
 
-    filepath = camera.capture(exposure=exposure, gain=gain)
+    filepath = camera.capture(exposure=req['exposure'], gain=req['gain'])
     if filepath:
         return jsonify({'success': True, 'filepath': filepath})
     else:
@@ -350,87 +559,85 @@ def api_solve():
     JSON: Solve result with PA error
     *****
     """
-    global last_solve_result, last_pa_error
-
     data = request.get_json() or {}
     filepath = data.get('filepath')
 
     if not filepath:
-        # Find most recent capture
-        import glob
-        captures = glob.glob(f"{config.CAPTURE_DIR}/capture_*.png")
-        if not captures:
+        filepath = get_camera_client().last_capture_path
+
+    if not filepath:
+        # Nothing captured this session; fall back to the newest file on disk
+        filepath = find_latest_capture()
+        if not filepath:
             return jsonify({'error': 'No captured images found'}), 400
-        filepath = max(captures, key=os.path.getctime)
 
     solver = get_plate_solver()
     mount = get_mount_client()
 
-    # Solve the image
-    result = solver.solve(filepath)
-    if not result:
-        return jsonify({'error': 'Plate solve failed'}), 500
-
-    last_solve_result = result
-
-    # Calculate PA error if mount is connected
+    # Read the mount position first so it can seed the solver's search
+    mount_ra = mount_dec = None
     if mount.connected:
         ra_str, dec_str = mount.get_position()
         mount_ra = parse_ra_string(ra_str) if ra_str else None
         mount_dec = parse_dec_string(dec_str) if dec_str else None
 
-        if mount_ra is not None and mount_dec is not None:
-            last_pa_error = calculate_pa_error(
-                result.ra, result.dec,
-                mount_ra, mount_dec
-            )
+    # Solve the image, unless it is the unchanged image solved last time
+    # (the UI may retry or re-request the same capture)
+    result = _state.solve
+    if not (result and result.source_path == filepath
+            and result.source_mtime_ns == _mtime_ns(filepath)):
+        result = solver.solve(
+            filepath,
+            ra_hint=mount_ra, dec_hint=mount_dec,
+            scale_hint=config.PLATE_SCALE_ARCSEC_PER_PX
+        )
+    if not result:
+        return jsonify({'error': 'Plate solve failed'}), 500
+
+    solve_status = set_last_solve_result(result)
+
+    # Calculate PA error if the mount position was readable
+    if mount_ra is not None and mount_dec is not None:
+        pa_error_status = set_last_pa_error(calculate_pa_error(
+            result.ra, result.dec,
+            mount_ra, mount_dec
+        ))
 
-            return jsonify({
-                'success': True,
-                'solved': {
-                    'ra': result.ra,
-                    'dec': result.dec,
-                    'ra_hms': result.ra_hms(),
-                    'dec_dms': result.dec_dms()
-                },
-                'mount': {
-                    'ra': mount_ra,
-                    'dec': mount_dec
-                },
-                'pa_error': {
-                    'az': last_pa_error.az_error,
-                    'alt': last_pa_error.alt_error,
-                    'total': last_pa_error.total_error,
-                    'aligned': last_pa_error.is_aligned()
-                }
-            })
+        return jsonify({
+            'success': True,
+            'solved': solve_status,
+            'mount': {
+                'ra': mount_ra,
+                'dec': mount_dec
+            },
+            'pa_error': pa_error_status
+        })
 
     return jsonify({
         'success': True,
-        'solved': {
-            'ra': result.ra,
-            'dec': result.dec,
-            'ra_hms': result.ra_hms(),
-            'dec_dms': result.dec_dms()
-        }
+        'solved': solve_status
     })
 
 
 @app.route('/api/auto-align/start', methods=['POST'])
 def api_auto_align_start():
     """Start automated polar alignment."""
-    global alignment_running, alignment_thread
-
-    if alignment_running:
-        return jsonify({'error': 'Alignment already running'}), 400
+    global _state, alignment_thread
 
-    data = request.get_json() or {}
     try:
-        target_accuracy = float(data.get('target_accuracy', config.TARGET_ACCURACY))
-    except (ValueError, TypeError):
-        return jsonify({'error': 'target_accuracy must be a number'}), 400
+        target_accuracy = parse_fields(
+            request.get_json() or {},
+            target_accuracy=(float, config.TARGET_ACCURACY)
+        )['target_accuracy']
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    # Check-and-set under the lock so two requests cannot both start a loop
+    with _state_lock:
+        if _state.running:
+            return jsonify({'error': 'Alignment already running'}), 400
+        _state = replace(_state, running=True)
 
-    alignment_running = True
     alignment_thread = threading.Thread(
         target=auto_align_loop,
         args=(target_accuracy,)
@@ -443,9 +650,7 @@ def api_auto_align_start():
 @app.route('/api/auto-align/stop', methods=['POST'])
 def api_auto_align_stop():
     """Stop automated polar alignment."""
-    global alignment_running
-
-    alignment_running = False
+    update_state(running=False)
     return jsonify({'success': True, 'message': 'Auto-align stopped'})
 
 
@@ -467,14 +672,24 @@ def api_settings():
         data = request.get_json() or {}
 
         try:
-            new_target = float(data['target_accuracy']) if 'target_accuracy' in data else None
-            new_lat = float(data['latitude']) if 'latitude' in data else None
-            new_lon = float(data['longitude']) if 'longitude' in data else None
-        except (ValueError, TypeError) as e:
+            req = parse_fields(
+                data,
+                target_accuracy=(float, None),
+                latitude=(float, None),
+                longitude=(float, None)
+            )
+        except ValueError as e:
             return jsonify({'error': f'Invalid numeric value: {e}'}), 400
+        new_target = req['target_accuracy']
+        new_lat = req['latitude']
+        new_lon = req['longitude']
 
         if new_target is not None:
             config.TARGET_ACCURACY = new_target
+            pa_error = _state.pa_error
+            if pa_error:
+                # 'aligned' depends on the target, so rebuild the fragment
+                set_last_pa_error(pa_error)
         if 'solver' in data:
             config.SOLVER = data['solver']
             get_plate_solver().set_solver(data['solver'])
@@ -638,40 +853,51 @@ def auto_align_loop(target_accuracy: float):
     None
     *****
     """
-    global alignment_running, last_pa_error, last_solve_result
-
     mount = get_mount_client()
     camera = get_camera_client()
     solver = get_plate_solver()
 
     iteration = 0
+
+    # Settings are fixed for the duration of a run
     max_iterations = config.MAX_ITERATIONS
+    exposure = config.DEFAULT_EXPOSURE
+    settle_time = config.SETTLE_TIME
+    scale_hint = config.PLATE_SCALE_ARCSEC_PER_PX
 
     emit_status('Auto-align started', 'info')
 
-    while alignment_running and iteration < max_iterations:
+    # Keep the preview grabber off the camera and CPU while aligning
+    camera.set_preview_enabled(False)
+
+    # After a failed solve (clouds, bad framing) the next one is likely to
+    # fail too, so the next frame is exposed while the solver runs. It only
+    # reflects the current pointing: it is reused if this solve fails as
+    # well, and discarded without waiting for it once a correction is
+    # applied. It is captured unpublished and only becomes the camera's
+    # last capture once the loop actually uses it.
+    capture_pool = ThreadPoolExecutor(max_workers=1)
+    prefetched = None
+    retry_likely = False
+
+    while _state.running and iteration < max_iterations:
         iteration += 1
         emit_status(f'Iteration {iteration}: Capturing...', 'info')
 
-        # 1. Capture image
-        filepath = camera.capture(exposure=config.DEFAULT_EXPOSURE)
+        # 1. Capture image (or take the frame exposed during the last solve)
+        if prefetched is not None:
+            filepath = prefetched.result()
+            prefetched = None
+            if filepath:
+                camera.last_capture_path = filepath
+        else:
+            filepath = camera.capture(exposure=exposure)
         if not filepath:
             emit_status('Capture failed', 'error')
             time.sleep(2)
             continue
 
-        emit_status(f'Iteration {iteration}: Solving...', 'info')
-
-        # 2. Plate solve
-        result = solver.solve(filepath)
-        if not result:
-            emit_status('Plate solve failed - check framing', 'warning')
-            time.sleep(2)
-            continue
-
-        last_solve_result = result
-
-        # 3. Get mount position
+        # 2. Get mount position (also used as the solver's search hint)
         ra_str, dec_str = mount.get_position()
         mount_ra = parse_ra_string(ra_str)
         mount_dec = parse_dec_string(dec_str)
@@ -681,12 +907,30 @@ def auto_align_loop(target_accuracy: float):
             time.sleep(2)
             continue
 
+        emit_status(f'Iteration {iteration}: Solving...', 'info')
+
+        # 3. Plate solve, exposing the next frame in parallel if a retry is likely
+        if retry_likely:
+            prefetched = capture_pool.submit(camera.capture, exposure=exposure, publish=False)
+        result = solver.solve(
+            filepath,
+            ra_hint=mount_ra, dec_hint=mount_dec,
+            scale_hint=scale_hint
+        )
+        retry_likely = not result
+        if not result:
+            emit_status('Plate solve failed - check framing', 'warning')
+            time.sleep(2)
+            continue
+
+        set_last_solve_result(result)
+
         # 4. Calculate PA error
         pa_error = calculate_pa_error(
             result.ra, result.dec,
             mount_ra, mount_dec
         )
-        last_pa_error = pa_error
+        set_last_pa_error(pa_error)
 
         emit_status(
             f'Iteration {iteration}: Error = {pa_error.total_error:.1f}" '
@@ -702,7 +946,11 @@ def auto_align_loop(target_accuracy: float):
             )
             break
 
-        # 6. Apply correction
+        # 6. Apply correction; any prefetched frame predates the move
+        if prefetched is not None:
+            _discard_when_done(camera, prefetched)
+            prefetched = None
+
         az_correction, alt_correction = calculate_correction(pa_error)
 
         emit_status(f'Applying correction: AZ={az_correction:+.2f}\', ALT={alt_correction:+.2f}\'', 'info')
@@ -711,26 +959,76 @@ def auto_align_loop(target_accuracy: float):
         mount.move_altitude(alt_correction)
 
         # 7. Wait for movement to complete
-        time.sleep(0.5)
-        wait_count = 0
-        while mount.is_adjusting() and wait_count < 30:
-            time.sleep(0.5)
-            wait_count += 1
+        mount.wait_until_idle(timeout=15.0)
 
         # 8. Settle time
-        time.sleep(config.SETTLE_TIME)
+        time.sleep(settle_time)
+
+    # Stopped, aligned or out of iterations with a frame still unused
+    if prefetched is not None:
+        _discard_when_done(camera, prefetched)
+    capture_pool.shutdown(wait=False)
+    camera.set_preview_enabled(True)
 
     if iteration >= max_iterations:
         emit_status(f'Max iterations ({max_iterations}) reached', 'warning')
 
-    alignment_running = False
+    update_state(running=False)
     emit_status('Auto-align finished', 'info')
 
 
+def _discard_when_done(camera, future):
+    """Delete a prefetched capture once its exposure finishes, without blocking the caller."""
+    future.add_done_callback(lambda f: camera.discard_capture(f.result()))
+
+
+# Status messages are queued and flushed to clients in batches so a burst
+# from the align loop costs one encode + socket write instead of one each
+STATUS_FLUSH_INTERVAL = 0.05  # seconds
+_status_queue = deque()  # unbounded: every message reaches the client
+_status_flusher = None
+_status_flusher_lock = threading.Lock()
+
+
 def emit_status(message: str, level: str = 'info'):
-    """Emit status message to all connected clients."""
-    socketio.emit('status', {'message': message, 'level': level})
+    """Queue status message for the next batched emit to all connected clients."""
+    global _status_flusher
     logger.info(f"[{level.upper()}] {message}")
+    _status_queue.append({'message': message, 'level': level})
+    with _status_flusher_lock:
+        if _status_flusher is None:
+            _status_flusher = socketio.start_background_task(_flush_status_queue)
+
+
+def _flush_status_queue():
+    """
+    *****
+    Purpose: Background task that emits queued status messages in batches
+
+    Drains the queue every STATUS_FLUSH_INTERVAL, dropping consecutive
+    duplicates, and exits once a flush finds nothing new.
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    *****
+    """
+    global _status_flusher
+    while True:
+        socketio.sleep(STATUS_FLUSH_INTERVAL)
+        with _status_flusher_lock:
+            if not _status_queue:
+                _status_flusher = None
+                return
+
+        messages = []
+        while _status_queue:
+            msg = _status_queue.popleft()
+            if not messages or messages[-1] != msg:
+                messages.append(msg)
+        socketio.emit('status', {'messages': messages})
 
 
 # ============================================================================
@@ -754,10 +1052,11 @@ def handle_disconnect():
 def handle_request_status():
     """Handle status request from client."""
     mount = get_mount_client()
+    snap = _state
 
     status = {
         'connected': mount.connected,
-        'alignment_running': alignment_running,
+        'alignment_running': snap.running,
     }
 
     if mount.connected:
@@ -765,12 +1064,8 @@ def handle_request_status():
         status['ra'] = ra
         status['dec'] = dec
 
-    if last_pa_error:
-        status['pa_error'] = {
-            'az': last_pa_error.az_error,
-            'alt': last_pa_error.alt_error,
-            'total': last_pa_error.total_error
-        }
+    if snap.pa_error_status:
+        status['pa_error'] = snap.pa_error_status
 
     emit('status_update', status)
 
@@ -785,5 +1080,8 @@ if __name__ == '__main__':
         app,
         host=config.WEB_HOST,
         port=config.WEB_PORT,
-        debug=config.DEBUG
+        debug=config.DEBUG,
+        # Werkzeug's development server is for local debugging only; the
+        # service runs under gunicorn (see gunicorn.conf.py)
+        allow_unsafe_werkzeug=config.DEBUG
     )
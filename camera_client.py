@@ -16,14 +16,19 @@ Supported backends:
 *****
 """
 
+import os
+import sys
 import time
+import struct
 import logging
-from datetime import datetime
+import tempfile
+import threading
 from typing import Optional
 from pathlib import Path
 
 try:
     import cv2
+    import numpy as np
     CV2_AVAILABLE = True
 except ImportError:
     CV2_AVAILABLE = False
@@ -47,6 +52,59 @@ import config
 
 logger = logging.getLogger(__name__)
 
+# V4L2 capability query (linux/videodev2.h): _IOR('V', 0, struct v4l2_capability)
+VIDIOC_QUERYCAP = 0x80685600
+V4L2_CAP_VIDEO_CAPTURE = 0x00000001
+V4L2_CAP_DEVICE_CAPS = 0x80000000
+
+# The preview grabber stops once get_preview() has not been called for this long
+PREVIEW_IDLE_TIMEOUT = 10.0  # seconds
+
+
+def _v4l2_is_capture_device(path: str) -> bool:
+    """
+    *****
+    Purpose: Check whether a V4L2 node supports video capture without opening it through OpenCV
+
+    Parameters:
+    str path: Device node path (e.g. '/dev/video0')
+
+    Returns:
+    bool: True if the node reports V4L2_CAP_VIDEO_CAPTURE, or if the query is
+    unavailable (so the device is not hidden on unusual drivers)
+    *****
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return True
+
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+    except OSError:
+        return False
+
+    try:
+        buf = bytearray(104)
+        fcntl.ioctl(fd, VIDIOC_QUERYCAP, buf)
+        capabilities, device_caps = struct.unpack_from('=II', buf, 84)
+        if capabilities & V4L2_CAP_DEVICE_CAPS:
+            capabilities = device_caps
+        return bool(capabilities & V4L2_CAP_VIDEO_CAPTURE)
+    except OSError:
+        return True
+    finally:
+        os.close(fd)
+
+
+def _is_raspberry_pi() -> bool:
+    """Check the device-tree model string for a Raspberry Pi."""
+    try:
+        with open('/proc/device-tree/model', 'rb') as f:
+            return b'Raspberry Pi' in f.read()
+    except OSError:
+        return False
+
 
 class CameraClient:
     """
@@ -67,9 +125,35 @@ class CameraClient:
         self.capture_dir = Path(config.CAPTURE_DIR)
         self._camera = None
         self._connected = False
-
-        # Ensure capture directory exists
-        self.capture_dir.mkdir(parents=True, exist_ok=True)
+        self.last_capture_path: Optional[str] = None
+        self._last_prune = 0.0
+
+        # Background grabber state (opencv/v4l2 only). _camera_lock serializes
+        # camera access; _frame_lock guards the latched preview frame and
+        # _grabber_lock the grabber's start/idle-stop bookkeeping.
+        self._camera_lock = threading.Lock()
+        self._frame_lock = threading.Lock()
+        self._grabber_lock = threading.Lock()
+        self._latest_frame = None
+        self._frame_buf = None
+        self._preview_buf = None
+        self._grabber_thread = None
+        self._grabber_stop = threading.Event()
+        self._grabber_paused = threading.Event()
+        self._frame_ready = threading.Event()
+        self._last_preview = 0.0
+        self._preview_enabled = True
+
+        # Ensure capture directory exists (e.g. /dev/shm is absent off Linux)
+        try:
+            self.capture_dir.mkdir(parents=True, exist_ok=True)
+            if not os.access(self.capture_dir, os.W_OK):
+                raise PermissionError(f"{self.capture_dir} is not writable")
+        except OSError as e:
+            fallback = Path(tempfile.gettempdir()) / 'oat-web-pa-captures'
+            logger.warning(f"Cannot use capture directory {self.capture_dir} ({e}); using {fallback}")
+            fallback.mkdir(parents=True, exist_ok=True)
+            self.capture_dir = fallback
 
     @property
     def connected(self) -> bool:
@@ -131,6 +215,12 @@ class CameraClient:
             self._camera.set(cv2.CAP_PROP_FRAME_WIDTH, 1920)
             self._camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 1080)
 
+            # Preallocate the capture buffer at the negotiated resolution so
+            # captures retrieve into it instead of allocating a frame each time
+            width = int(self._camera.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(self._camera.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            self._frame_buf = np.empty((height, width, 3), dtype=np.uint8)
+
             self._connected = True
             logger.info(f"Connected to camera via OpenCV: device {self.device}")
             return True
@@ -139,6 +229,92 @@ class CameraClient:
             logger.error(f"OpenCV connection error: {e}")
             return False
 
+    def _ensure_grabber(self) -> bool:
+        """Note a preview request and start the grabber thread if it is not running; False while previews are disabled."""
+        with self._grabber_lock:
+            if not self._preview_enabled:
+                return False
+            self._last_preview = time.monotonic()
+            if self._grabber_thread is None:
+                self._grabber_stop.clear()
+                self._frame_ready.clear()
+                self._grabber_thread = threading.Thread(target=self._grab_loop, daemon=True)
+                self._grabber_thread.start()
+        return True
+
+    def _stop_grabber(self):
+        """Stop the background grabber thread and drop the latched frame."""
+        self._grabber_stop.set()
+        with self._grabber_lock:
+            thread, self._grabber_thread = self._grabber_thread, None
+        if thread:
+            thread.join(timeout=2.0)
+        with self._frame_lock:
+            self._latest_frame = None
+            self._preview_buf = None
+
+    def set_preview_enabled(self, enabled: bool):
+        """
+        *****
+        Purpose: Allow or block the preview grabber (blocked during auto-align
+        so it does not compete with captures and the plate solver)
+
+        Parameters:
+        bool enabled: False stops the grabber and makes get_preview() return None
+
+        Returns:
+        None
+        *****
+        """
+        with self._grabber_lock:
+            self._preview_enabled = enabled
+        if not enabled:
+            self._stop_grabber()
+
+    def _grab_loop(self):
+        """
+        *****
+        Purpose: Continuously grab frames so previews never block on the camera frame rate
+
+        Frames are retrieved into a back buffer and swapped with the latched
+        frame under _frame_lock, so two buffers are reused for the lifetime
+        of the thread instead of allocating one per frame. The thread exits
+        once no preview has been requested for PREVIEW_IDLE_TIMEOUT.
+
+        Parameters:
+        None
+
+        Returns:
+        None
+        *****
+        """
+        back = np.empty_like(self._frame_buf) if self._frame_buf is not None else None
+        while not self._grabber_stop.is_set():
+            with self._grabber_lock:
+                if time.monotonic() - self._last_preview > PREVIEW_IDLE_TIMEOUT:
+                    if self._grabber_thread is threading.current_thread():
+                        self._grabber_thread = None
+                        with self._frame_lock:
+                            self._latest_frame = None
+                    break
+
+            if self._grabber_paused.is_set():
+                time.sleep(0.05)
+                continue
+
+            with self._camera_lock:
+                ok = self._camera is not None and self._camera.grab()
+                if ok:
+                    ok, back = self._camera.retrieve(back)
+
+            if not ok or back is None:
+                time.sleep(0.05)
+                continue
+
+            with self._frame_lock:
+                self._latest_frame, back = back, self._latest_frame
+            self._frame_ready.set()
+
     def _connect_picamera(self) -> bool:
         """Connect to Raspberry Pi camera module."""
         if not PICAMERA_AVAILABLE:
@@ -178,9 +354,13 @@ class CameraClient:
         None
         *****
         """
+        self._stop_grabber()
+        self._frame_buf = None
+
         if self._camera:
             if self.camera_type in ('opencv', 'v4l2') and CV2_AVAILABLE:
-                self._camera.release()
+                with self._camera_lock:
+                    self._camera.release()
             elif self.camera_type == 'picamera' and PICAMERA_AVAILABLE:
                 self._camera.stop()
                 self._camera.close()
@@ -190,7 +370,7 @@ class CameraClient:
         logger.info("Camera disconnected")
 
     def capture(self, exposure: float = None, gain: int = None,
-                filename: str = None) -> Optional[str]:
+                filename: str = None, publish: bool = True) -> Optional[str]:
         """
         *****
         Purpose: Capture an image
@@ -199,6 +379,8 @@ class CameraClient:
         float exposure: Exposure time in seconds (if supported)
         int gain: Camera gain (if supported)
         str filename: Optional output filename
+        bool publish: Record the image as last_capture_path (False for
+            speculative captures the caller may still discard)
 
         Returns:
         str: Path to captured image file, or None on error
@@ -213,61 +395,140 @@ class CameraClient:
         if gain is None:
             gain = config.DEFAULT_GAIN
 
-        # Generate filename if not provided
+        # Generate filename if not provided (ns timestamp: back-to-back captures never collide)
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"capture_{timestamp}.png"
+            filename = f"capture_{time.time_ns()}.png"
 
         filepath = self.capture_dir / filename
 
         try:
+            result = None
             if self.camera_type in ('opencv', 'v4l2'):
-                return self._capture_opencv(filepath, exposure, gain)
+                result = self._capture_opencv(filepath, exposure, gain)
             elif self.camera_type == 'picamera':
-                return self._capture_picamera(filepath, exposure, gain)
+                result = self._capture_picamera(filepath, exposure, gain)
             elif self.camera_type == 'indi':
-                return self._capture_indi(filepath, exposure, gain)
+                result = self._capture_indi(filepath, exposure, gain)
 
         except Exception as e:
             logger.error(f"Capture error: {e}")
             return None
 
+        if result:
+            if publish:
+                self.last_capture_path = result
+            if time.monotonic() - self._last_prune > 60:
+                self._last_prune = time.monotonic()
+                self.prune_captures()
+        return result
+
+    def discard_capture(self, path: Optional[str]):
+        """
+        *****
+        Purpose: Delete an unpublished capture that will not be used
+
+        Parameters:
+        str path: Image path returned by capture(publish=False), or None
+
+        Returns:
+        None
+        *****
+        """
+        if not path or path == self.last_capture_path:
+            return
+        try:
+            os.unlink(path)
+        except OSError as e:
+            logger.warning(f"Could not remove discarded capture {path}: {e}")
+
+    def prune_captures(self, max_age: float = None) -> int:
+        """
+        *****
+        Purpose: Delete captured images older than the retention period
+
+        Parameters:
+        float max_age: Maximum age in seconds (uses config.CAPTURE_RETENTION if None; 0 keeps everything)
+
+        Returns:
+        int: Number of files removed
+        *****
+        """
+        if max_age is None:
+            max_age = config.CAPTURE_RETENTION
+        if not max_age:
+            return 0
+
+        cutoff = time.time() - max_age
+        removed = 0
+        try:
+            with os.scandir(self.capture_dir) as it:
+                for entry in it:
+                    if not entry.name.startswith('capture_') or entry.path == self.last_capture_path:
+                        continue
+                    try:
+                        if entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                            removed += 1
+                    except OSError as e:
+                        logger.warning(f"Could not remove old capture {entry.name}: {e}")
+        except OSError as e:
+            logger.warning(f"Could not scan capture directory: {e}")
+
+        if removed:
+            logger.info(f"Removed {removed} old capture(s)")
+        return removed
+
     def _capture_opencv(self, filepath: Path, exposure: float, gain: int) -> Optional[str]:
         """Capture frame via OpenCV (cross-platform)."""
-        # Set exposure if possible (may not work on all cameras)
-        self._camera.set(cv2.CAP_PROP_EXPOSURE, exposure * 1000)  # ms
-        self._camera.set(cv2.CAP_PROP_GAIN, gain)
-
-        # For longer exposures, we might need multiple frame grabs
-        # to allow the camera to adjust
-        if exposure > 0.5:
-            # Grab a few frames to let camera adjust
-            for _ in range(5):
-                self._camera.grab()
-            time.sleep(exposure)
-
-        ret, frame = self._camera.read()
-
-        if not ret or frame is None:
-            logger.error("Failed to capture frame")
-            return None
+        # Hold the grabber off so it does not contend for the camera lock
+        self._grabber_paused.set()
+        try:
+            with self._camera_lock:
+                # Set exposure if possible (may not work on all cameras)
+                self._camera.set(cv2.CAP_PROP_EXPOSURE, exposure * 1000)  # ms
+                self._camera.set(cv2.CAP_PROP_GAIN, gain)
+
+                # For longer exposures, we might need multiple frame grabs
+                # to allow the camera to adjust
+                if exposure > 0.5:
+                    # Grab a few frames to let camera adjust
+                    for _ in range(5):
+                        self._camera.grab()
+                    time.sleep(exposure)
+
+                if self._camera.grab():
+                    ret, frame = self._camera.retrieve(self._frame_buf)
+                else:
+                    ret, frame = False, None
+
+                if not ret or frame is None:
+                    logger.error("Failed to capture frame")
+                    return None
+
+                # frame is the shared _frame_buf, so save it before another
+                # capture can retrieve into it. Fast deflate: the solver gains
+                # nothing from smaller PNGs
+                cv2.imwrite(str(filepath), frame, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+        finally:
+            self._grabber_paused.clear()
 
-        # Save image
-        cv2.imwrite(str(filepath), frame)
         logger.info(f"Captured image: {filepath}")
         return str(filepath)
 
     def _capture_picamera(self, filepath: Path, exposure: float, gain: int) -> Optional[str]:
         """Capture image from Pi Camera."""
-        # Set exposure and gain
-        self._camera.set_controls({
-            "ExposureTime": int(exposure * 1000000),  # microseconds
-            "AnalogueGain": gain / 100.0
-        })
-        time.sleep(exposure + 0.5)  # Wait for exposure
-
-        # Capture
-        self._camera.capture_file(str(filepath))
+        # One capture at a time, so a background capture cannot change the
+        # controls or grab the sensor in the middle of another
+        with self._camera_lock:
+            # Set exposure and gain
+            self._camera.set_controls({
+                "ExposureTime": int(exposure * 1000000),  # microseconds
+                "AnalogueGain": gain / 100.0
+            })
+            time.sleep(exposure + 0.5)  # Wait for exposure
+
+            # Capture
+            self._camera.capture_file(str(filepath))
         logger.info(f"Captured image: {filepath}")
         return str(filepath)
 
@@ -293,24 +554,33 @@ class CameraClient:
 
         try:
             if self.camera_type in ('opencv', 'v4l2'):
-                ret, frame = self._camera.read()
-                if not ret or frame is None:
+                # Use the frame latched by the grabber thread rather than
+                # blocking on a fresh read(); the lock is held only for the
+                # resize + encode since the grabber reuses the buffer. The
+                # grabber only runs while previews are being requested
+                if not self._ensure_grabber():
                     return None
-
-                # Resize
-                height, width = frame.shape[:2]
-                new_size = (int(width * scale), int(height * scale))
-                small = cv2.resize(frame, new_size)
-
-                # Encode as JPEG
-                _, jpeg = cv2.imencode('.jpg', small, [cv2.IMWRITE_JPEG_QUALITY, 70])
+                self._frame_ready.wait(timeout=1.0)
+                with self._frame_lock:
+                    frame = self._latest_frame
+                    if frame is None:
+                        return None
+
+                    height, width = frame.shape[:2]
+                    new_size = (int(width * scale), int(height * scale))
+                    self._preview_buf = cv2.resize(frame, new_size, dst=self._preview_buf,
+                                                   interpolation=cv2.INTER_AREA)
+
+                    _, jpeg = cv2.imencode('.jpg', self._preview_buf,
+                                           [cv2.IMWRITE_JPEG_QUALITY, 70, cv2.IMWRITE_JPEG_OPTIMIZE, 0])
                 return jpeg.tobytes()
 
             elif self.camera_type == 'picamera':
                 # Capture to memory
                 import io
                 stream = io.BytesIO()
-                self._camera.capture_file(stream, format='jpeg')
+                with self._camera_lock:
+                    self._camera.capture_file(stream, format='jpeg')
                 return stream.getvalue()
 
         except Exception as e:
@@ -330,24 +600,33 @@ class CameraClient:
         list: List of available device identifiers (indices or paths)
         *****
         """
-        import sys
         devices = []
 
-        # Check OpenCV devices (cross-platform)
-        if CV2_AVAILABLE:
+        if sys.platform.startswith('linux'):
+            # Enumerate existing nodes instead of opening indices blindly;
+            # each VideoCapture open costs a full driver probe
+            try:
+                with os.scandir('/dev') as it:
+                    nodes = [e.name for e in it
+                             if e.name.startswith('video') and e.name[5:].isdigit()]
+            except OSError as e:
+                logger.warning(f"Cannot scan /dev for video devices: {e}")
+                nodes = []
+            for name in sorted(nodes, key=lambda n: int(n[5:])):
+                path = f"/dev/{name}"
+                if _v4l2_is_capture_device(path):
+                    devices.append(path)
+
+        elif CV2_AVAILABLE:
+            # Windows/macOS have no device nodes to scan; probe by index
             for i in range(10):
                 cap = cv2.VideoCapture(i)
                 if cap.isOpened():
-                    # Use platform-appropriate identifier
-                    if sys.platform.startswith('linux'):
-                        devices.append(f"/dev/video{i}")
-                    else:
-                        # Windows/macOS use device index
-                        devices.append(str(i))
+                    devices.append(str(i))
                     cap.release()
 
-        # Check Pi Camera (Linux only)
-        if PICAMERA_AVAILABLE:
+        # Check Pi Camera (only worth constructing on Pi hardware)
+        if PICAMERA_AVAILABLE and _is_raspberry_pi():
             try:
                 cam = Picamera2()
                 cam.close()
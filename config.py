@@ -30,6 +30,9 @@ SOLVER = "astap"  # Options: "astap", "astrometry"
 ASTAP_PATH = "/usr/bin/astap_cli"
 ASTROMETRY_PATH = "/usr/bin/solve-field"
 SOLVER_TIMEOUT = 60  # seconds
+SOLVER_RADIUS_DEG = 30  # search radius around the mount's RA/DEC hint
+SOLVER_WORKERS = 2  # parallel solver processes for PlateSolver.solve_batch
+PLATE_SCALE_ARCSEC_PER_PX = None  # camera + lens plate scale; None = let the solver search all scales
 
 # Default capture settings
 DEFAULT_EXPOSURE = 2.0  # seconds
@@ -55,7 +58,10 @@ WEB_PORT = 5000
 DEBUG = False
 
 # File Paths
-CAPTURE_DIR = "/var/lib/oat-web-pa/captures"
+# Captures are transient solver input, so keep them in RAM (tmpfs) to spare
+# the SD card; CameraClient falls back to the system temp dir if unwritable
+CAPTURE_DIR = "/dev/shm/oat-web-pa/captures"
+CAPTURE_RETENTION = 3600  # seconds to keep captured images; 0 = keep forever
 
 # Load local configuration overrides from /etc/oat-web-pa/config.py.
 # This file is created by the .deb postinst script and is the intended
@@ -0,0 +1,25 @@
+"""
+*****
+Purpose: Gunicorn settings for running the OAT PA server as a service
+
+Flask-SocketIO's threading mode needs a single worker process (alignment
+state, hardware clients and socket sessions live in that process) and
+gthread workers; each open WebSocket holds one thread for its lifetime,
+so threads bounds browser tabs plus concurrent HTTP requests.
+
+Parameters:
+None - Bind address loaded from config.py (including /etc overrides)
+
+Returns:
+None
+*****
+"""
+
+# Aliased: a module-level name 'config' would be read as gunicorn's own setting
+import config as oat_config
+
+bind = f"{oat_config.WEB_HOST}:{oat_config.WEB_PORT}"
+workers = 1
+worker_class = "gthread"
+threads = 16
+loglevel = "debug" if oat_config.DEBUG else "info"
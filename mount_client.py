@@ -10,10 +10,13 @@ MountClient class for telescope control
 *****
 """
 
+import os
+import re
 import time
+import select
 import logging
 import threading
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 try:
     import PyIndi
@@ -33,6 +36,19 @@ import config
 
 logger = logging.getLogger(__name__)
 
+# :GX# motion field (RA, DEC, Track, AZ, ALT flags) is the 2nd comma field
+_MOTION_RE = re.compile(rb'[^,]*,([^,]{5})')
+
+# AZ/ALT adjustment commands, formatted straight to bytes
+_AZ_TPL = b":MAZ%+.2f#"
+_AL_TPL = b":MAL%+.2f#"
+
+# Fixed-set commands, prebuilt as bytes and keyed by their argument
+_SLEW_CMDS = {d: b":M%s#" % d.encode('ascii') for d in 'nsew'}
+_STOP_CMDS = {d: b":Q%s#" % d.encode('ascii') for d in 'nsew'}
+_STOP_CMDS['a'] = b":Q#"
+_RATE_CMDS = {r: b":R%s#" % r.encode('ascii') for r in 'SMCG'}
+
 
 if INDI_AVAILABLE:
     class IndiClient(PyIndi.BaseClient):
@@ -107,7 +123,12 @@ class MountClient:
         self.serial_conn = None
         self.telescope_name = config.TELESCOPE_NAME
         self._connected = False
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()  # Reentrant so composite queries hold it across commands
+        self._rx_dirty = False  # Stale bytes may be waiting after a failed read
+        self._rx_fd = None  # Raw port fd for chunked reads (POSIX only)
+        self._rx_buf = bytearray()  # Bytes read from _rx_fd but not yet consumed
+        self._status_cache = (0.0, None)  # (monotonic timestamp, :GX# reply)
+        self._status_ttl = 0.05
 
     @property
     def connected(self) -> bool:
@@ -189,10 +210,24 @@ class MountClient:
                 timeout=2.0,
                 write_timeout=2.0
             )
+
+            # Drop the USB-serial latency timer (16 ms on FTDI) to 1 ms so
+            # short Meade replies are delivered immediately (POSIX only)
+            try:
+                self.serial_conn.set_low_latency_mode(True)
+            except (IOError, OSError, AttributeError, ValueError, NotImplementedError) as e:
+                logger.debug(f"Low latency mode unavailable on {port}: {e}")
+
+            # pyserial's read_until() costs a select() + read() per byte; on
+            # POSIX read the fd directly in chunks instead
+            if os.name == 'posix':
+                self._rx_fd = self.serial_conn.fileno()
+                self._rx_buf.clear()
+
             time.sleep(0.5)  # Allow connection to stabilize
 
             # Verify connection with product name query
-            response = self._serial_command(":GVP#")
+            response = (self._serial_command(b":GVP#") or b"").decode('ascii', errors='ignore')
             if response and "OpenAstro" in response:
                 self.mode = 'serial'
                 self._connected = True
@@ -200,11 +235,13 @@ class MountClient:
                 return True
             else:
                 logger.error(f"Unexpected response: {response}")
+                self._rx_fd = None
                 self.serial_conn.close()
                 return False
 
         except Exception as e:
             logger.error(f"Serial connection error: {e}")
+            self._rx_fd = None
             if self.serial_conn:
                 self.serial_conn.close()
             return False
@@ -225,6 +262,7 @@ class MountClient:
             self.indi_client.disconnectServer()
             self.indi_client = None
         elif self.mode == 'serial' and self.serial_conn:
+            self._rx_fd = None
             self.serial_conn.close()
             self.serial_conn = None
 
@@ -232,24 +270,34 @@ class MountClient:
         self._connected = False
         logger.info("Disconnected from mount")
 
-    def send_command(self, command: str, expect_response: bool = True) -> Optional[str]:
+    def send_command(self, command: Union[str, bytes], expect_response: bool = True) -> Optional[str]:
         """
         *****
         Purpose: Send Meade LX200 command to mount
 
         Parameters:
-        str command: Meade command (e.g., ':GR#', ':MAZ+5.0#')
+        str|bytes command: Meade command (e.g., ':GR#', b':MAZ+5.0#')
         bool expect_response: Whether to wait for response
 
         Returns:
         str: Response string or None if no response/error
         *****
         """
+        raw = self._query(command, expect_response)
+        return None if raw is None else raw.decode('ascii', errors='ignore')
+
+    def _query(self, command: Union[str, bytes], expect_response: bool = True) -> Optional[bytes]:
+        """Send a command and return the raw reply bytes (terminator stripped)."""
         if not self._connected:
             logger.error("Not connected")
             return None
 
         with self._lock:
+            # Any motion or stop command makes a cached status reply stale.
+            # Clear it under the lock so a :GX# query already in flight
+            # cannot store its pre-move reply afterwards
+            if command[:2] in (':M', ':Q', b':M', b':Q'):
+                self._status_cache = (0.0, None)
             if self.mode == 'serial':
                 return self._serial_command(command, expect_response)
             elif self.mode == 'indi':
@@ -257,37 +305,109 @@ class MountClient:
 
         return None
 
-    def _serial_command(self, command: str, expect_response: bool = True) -> Optional[str]:
+    def _serial_command(self, command: Union[str, bytes], expect_response: bool = True) -> Optional[bytes]:
         """Send command via serial port."""
         try:
-            # Clear input buffer
-            self.serial_conn.reset_input_buffer()
+            # Only flush the input buffer if a previous read left it out of sync
+            # or stray bytes (e.g. a late reply) are already waiting
+            if self._rx_dirty or self._rx_buf or self.serial_conn.in_waiting:
+                self.serial_conn.reset_input_buffer()
+                self._rx_buf.clear()
+                self._rx_dirty = False
 
             # Send command
-            self.serial_conn.write(command.encode('ascii'))
+            self.serial_conn.write(command if isinstance(command, bytes) else command.encode('ascii'))
 
             if not expect_response:
-                return ""
-
-            # Read response until # terminator
-            response = ""
-            start_time = time.time()
-            while time.time() - start_time < 2.0:
-                if self.serial_conn.in_waiting:
-                    char = self.serial_conn.read(1).decode('ascii', errors='ignore')
-                    if char == '#':
-                        break
-                    response += char
-                else:
-                    time.sleep(0.01)
-
-            return response
+                return b""
+
+            # Block until the # terminator arrives (bounded by the port timeout)
+            # and hand back the raw bytes; callers decode only if they need str
+            if self._rx_fd is not None:
+                raw = self._read_reply()
+            else:
+                raw = self.serial_conn.read_until(b'#')
+            if raw.endswith(b'#'):
+                raw = raw[:-1]
+            else:
+                self._rx_dirty = True
+
+            return raw
 
         except Exception as e:
+            self._rx_dirty = True
             logger.error(f"Serial command error: {e}")
             return None
 
-    def _indi_command(self, command: str, expect_response: bool = True) -> Optional[str]:
+    def _write_only(self, command: bytes):
+        """
+        *****
+        Purpose: Send a fire-and-forget command with nothing but the write
+
+        Skips the input-buffer check and reply handling of _serial_command;
+        any stray reply is flushed before the next query instead.
+
+        Parameters:
+        bytes command: Complete Meade command (e.g. b':Q#')
+
+        Returns:
+        None
+        *****
+        """
+        if not self._connected:
+            logger.error("Not connected")
+            return
+
+        if self.mode != 'serial':
+            self._query(command, expect_response=False)
+            return
+
+        with self._lock:
+            # Every write-only command moves the mount or changes its motion
+            self._status_cache = (0.0, None)
+            try:
+                self.serial_conn.write(command)
+            except Exception as e:
+                self._rx_dirty = True
+                logger.error(f"Serial command error: {e}")
+
+    def _read_reply(self) -> bytes:
+        """
+        *****
+        Purpose: Read one #-terminated reply from the raw serial fd
+
+        Reads whatever the driver has buffered (up to 512 bytes) per syscall
+        instead of one byte at a time; any bytes past the terminator stay in
+        _rx_buf and are flushed before the next command.
+
+        Parameters:
+        None
+
+        Returns:
+        bytes: Reply including the '#', or the partial reply on timeout
+        *****
+        """
+        deadline = time.monotonic() + (self.serial_conn.timeout or 0.0)
+        buf = self._rx_buf
+        while True:
+            end = buf.find(b'#')
+            if end >= 0:
+                reply = bytes(buf[:end + 1])
+                del buf[:end + 1]
+                return reply
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([self._rx_fd], [], [], remaining)[0]:
+                reply = bytes(buf)
+                buf.clear()
+                return reply
+
+            chunk = os.read(self._rx_fd, 512)
+            if not chunk:
+                raise OSError("serial device returned no data (disconnected?)")
+            buf += chunk
+
+    def _indi_command(self, command: Union[str, bytes], expect_response: bool = True) -> Optional[bytes]:
         """Send command via INDI (requires driver support)."""
         # Note: This requires the INDI driver to support command passthrough
         # For LX200-compatible mounts, we may need to disconnect INDI and use serial
@@ -308,10 +428,41 @@ class MountClient:
         Tuple[str, str]: (RA string 'HH:MM:SS', DEC string 'sDD*MM:SS') or (None, None)
         *****
         """
-        ra = self.send_command(":GR#")
-        dec = self.send_command(":GD#")
+        # One :GX# round-trip carries both coordinates; fall back to :GR#/:GD#
+        # under one lock hold so no move command lands between the two reads
+        with self._lock:
+            ra, dec = self._parse_status_position(self._status_raw())
+            if ra is None:
+                ra = self.send_command(b":GR#")
+                dec = self.send_command(b":GD#")
         return (ra, dec)
 
+    def _parse_status_position(self, status: Optional[bytes]) -> Tuple[Optional[str], Optional[str]]:
+        """
+        *****
+        Purpose: Extract RA/DEC from an OAT :GX# status string
+
+        The status reply is "State,Motion,RAsteps,DECsteps,TRKsteps,HHMMSS,sDDMMSS,..."
+        and the coordinates are reformatted to match the :GR#/:GD# replies.
+
+        Parameters:
+        bytes status: Raw :GX# response (without terminator)
+
+        Returns:
+        Tuple[str, str]: (RA 'HH:MM:SS', DEC 'sDD*MM:SS') or (None, None)
+        *****
+        """
+        if not status:
+            return (None, None)
+        parts = status.split(b',')
+        if len(parts) < 7:
+            return (None, None)
+        ra, dec = parts[5], parts[6]
+        if len(ra) != 6 or not ra.isdigit() or len(dec) != 7 or dec[0:1] not in (b'+', b'-') or not dec[1:].isdigit():
+            return (None, None)
+        ra, dec = ra.decode('ascii'), dec.decode('ascii')
+        return (f"{ra[0:2]}:{ra[2:4]}:{ra[4:6]}", f"{dec[0:3]}*{dec[3:5]}:{dec[5:7]}")
+
     def get_status(self) -> Optional[str]:
         """
         *****
@@ -324,7 +475,32 @@ class MountClient:
         str: Status string from :GX# command
         *****
         """
-        return self.send_command(":GX#")
+        status = self._status_raw()
+        return None if status is None else status.decode('ascii', errors='ignore')
+
+    def _status_raw(self) -> Optional[bytes]:
+        """Return the raw :GX# reply, reusing one fetched within the last 50 ms."""
+        # Back-to-back queries (position, slewing, tracking, adjusting) within
+        # a few ms share one serial round-trip. The lock is held from the
+        # cache check to the store so a move cannot slip in between
+        with self._lock:
+            stamp, status = self._status_cache
+            now = time.monotonic()
+            if status is not None and now - stamp < self._status_ttl:
+                return status
+            status = self._query(b":GX#")
+            if status:
+                self._status_cache = (now, status)
+            return status
+
+    def _status_motion(self) -> Optional[bytes]:
+        """Return the 5-byte motion field (RA, DEC, Track, AZ, ALT) of :GX#, or None."""
+        status = self._status_raw()
+        if status:
+            m = _MOTION_RE.match(status)
+            if m:
+                return m.group(1)
+        return None
 
     def is_slewing(self) -> bool:
         """
@@ -338,8 +514,10 @@ class MountClient:
         bool: True if slewing
         *****
         """
-        response = self.send_command(":GIS#")
-        return response == "1"
+        motion = self._status_motion()
+        if motion is not None:
+            return motion[0:1] != b'-' or motion[1:2] != b'-'
+        return self._query(b":GIS#") == b"1"
 
     def is_tracking(self) -> bool:
         """
@@ -353,8 +531,10 @@ class MountClient:
         bool: True if tracking
         *****
         """
-        response = self.send_command(":GIT#")
-        return response == "1"
+        motion = self._status_motion()
+        if motion is not None:
+            return motion[2:3] == b'T'
+        return self._query(b":GIT#") == b"1"
 
     def is_adjusting(self) -> bool:
         """
@@ -368,19 +548,42 @@ class MountClient:
         bool: True if AZ or ALT is adjusting
         *****
         """
-        status = self.get_status()
-        if status:
-            # Status format: "State,--T--,..." where position 4,5 are AZ,ALT flags
-            parts = status.split(',')
-            if len(parts) >= 2:
-                motion = parts[1]
-                if len(motion) >= 5:
-                    # Position 3 is AZ (Z/z/-), Position 4 is ALT (A/a/-)
-                    az_moving = motion[3] != '-'
-                    alt_moving = motion[4] != '-'
-                    return az_moving or alt_moving
+        # Status format: "State,--T--,..." where position 4,5 are AZ,ALT flags
+        motion = self._status_motion()
+        if motion is not None:
+            # Position 3 is AZ (Z/z/-), Position 4 is ALT (A/a/-)
+            az_moving = motion[3:4] != b'-'
+            alt_moving = motion[4:5] != b'-'
+            return az_moving or alt_moving
         return False
 
+    def wait_until_idle(self, timeout: float = 15.0) -> bool:
+        """
+        *****
+        Purpose: Block until the AZ/ALT motors stop moving
+
+        Polls with a progressive backoff (10 ms doubling up to 200 ms) so
+        short moves return almost immediately while long ones do not flood
+        the serial link with status queries.
+
+        Parameters:
+        float timeout: Maximum time to wait in seconds
+
+        Returns:
+        bool: True if the motors went idle, False on timeout
+        *****
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.01
+        while self.is_adjusting():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(f"Mount still adjusting after {timeout:.1f}s")
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.2)
+        return True
+
     def start_slew(self, direction: str):
         """
         *****
@@ -393,9 +596,9 @@ class MountClient:
         None
         *****
         """
-        direction = direction.lower()
-        if direction in ['n', 's', 'e', 'w']:
-            self.send_command(f":M{direction}#", expect_response=False)
+        cmd = _SLEW_CMDS.get(direction.lower())
+        if cmd is not None:
+            self._write_only(cmd)
         else:
             logger.error(f"Invalid direction: {direction}")
 
@@ -411,11 +614,9 @@ class MountClient:
         None
         *****
         """
-        direction = direction.lower()
-        if direction == 'a':
-            self.send_command(":Q#", expect_response=False)
-        elif direction in ['n', 's', 'e', 'w']:
-            self.send_command(f":Q{direction}#", expect_response=False)
+        cmd = _STOP_CMDS.get(direction.lower())
+        if cmd is not None:
+            self._write_only(cmd)
 
     def set_slew_rate(self, rate: str):
         """
@@ -429,9 +630,9 @@ class MountClient:
         None
         *****
         """
-        rate = rate.upper()
-        if rate in ['S', 'M', 'C', 'G']:
-            self.send_command(f":R{rate}#", expect_response=False)
+        cmd = _RATE_CMDS.get(rate.upper())
+        if cmd is not None:
+            self._write_only(cmd)
 
     def move_azimuth(self, arcminutes: float):
         """
@@ -445,9 +646,8 @@ class MountClient:
         None
         *****
         """
-        cmd = f":MAZ{arcminutes:+.2f}#"
-        self.send_command(cmd, expect_response=False)
-        logger.info(f"Moving AZ by {arcminutes:.2f} arcmin")
+        self._write_only(_AZ_TPL % arcminutes)
+        logger.info("Moving AZ by %.2f arcmin", arcminutes)
 
     def move_altitude(self, arcminutes: float):
         """
@@ -461,9 +661,8 @@ class MountClient:
         None
         *****
         """
-        cmd = f":MAL{arcminutes:+.2f}#"
-        self.send_command(cmd, expect_response=False)
-        logger.info(f"Moving ALT by {arcminutes:.2f} arcmin")
+        self._write_only(_AL_TPL % arcminutes)
+        logger.info("Moving ALT by %.2f arcmin", arcminutes)
 
     def set_tracking(self, enabled: bool):
         """
@@ -477,7 +676,7 @@ class MountClient:
         None
         *****
         """
-        cmd = ":MT1#" if enabled else ":MT0#"
+        cmd = b":MT1#" if enabled else b":MT0#"
         self.send_command(cmd)
 
     def get_az_alt_position(self) -> Tuple[Optional[int], Optional[int]]:
@@ -492,12 +691,14 @@ class MountClient:
         Tuple[int, int]: (AZ steps, ALT steps) or (None, None)
         *****
         """
-        response = self.send_command(":XGAA#")
+        response = self._query(b":XGAA#")
         if response:
-            parts = response.split('|')
-            if len(parts) >= 2:
+            # "AZ|ALT|..." - slice around the first '|' rather than splitting
+            sep = response.find(b'|')
+            if sep > 0:
+                end = response.find(b'|', sep + 1)
                 try:
-                    return (int(parts[0]), int(parts[1]))
+                    return (int(response[:sep]), int(response[sep + 1:end if end >= 0 else None]))
                 except ValueError:
                     pass
         return (None, None)
@@ -514,7 +715,7 @@ class MountClient:
         None
         *****
         """
-        self.send_command(":MAAH#", expect_response=False)
+        self._write_only(b":MAAH#")
 
     def _parse_lx200_angle(self, raw: str) -> Optional[float]:
         """
@@ -567,8 +768,9 @@ class MountClient:
         Tuple[float, float]: (latitude_degrees, longitude_degrees) or (None, None)
         *****
         """
-        lat_raw = self.send_command(":Gt#")
-        lon_raw = self.send_command(":Gg#")
+        with self._lock:
+            lat_raw = self.send_command(b":Gt#")
+            lon_raw = self.send_command(b":Gg#")
 
         logger.debug(f"get_site_location raw: lat={lat_raw!r} lon={lon_raw!r}")
 
@@ -14,17 +14,41 @@ Functions for PA error calculation
 *****
 """
 
+import re
 import math
 import logging
 from typing import Tuple, Optional
 from dataclasses import dataclass
 
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    # Not a warning - numba is an optional accelerator
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
+
 import config
 
 logger = logging.getLogger(__name__)
 
+# Radians -> arcminutes scale factor
+_DEG_PER_RAD_X_60 = math.degrees(1.0) * 60
+
+# Fast paths for the usual 'sHH:MM:SS[.ss]' and 'sDD*MM[:SS[.s]]' replies (also
+# ':' / "'" separators, trailing '"'); other forms use the general split parsers
+_RA_RE = re.compile(r'\s*([+-]?\d+):(\d+):(\d+(?:\.\d*)?)\s*$')
+_DEC_RE = re.compile(r'\s*([+-]?)(\d+)[:*](\d+)(?:[:\'](\d+(?:\.\d*)?))?"?\s*$')
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class PAError:
     """
     *****
@@ -84,6 +108,104 @@ def calculate_pa_error(
     if latitude is None:
         latitude = config.LATITUDE
 
+    az_error, alt_error, total_error_arcsec, delta_ra_arcmin, delta_dec_arcmin, near_pole = \
+        _pa_error_core(float(solved_ra), float(solved_dec), float(mount_ra), float(mount_dec))
+
+    if near_pole:
+        logger.warning("Mount DEC is near the pole (cos_dec < 0.1); AZ error calculation is approximate")
+
+    logger.debug(f"PA Error: dRA={delta_ra_arcmin:.2f}' dDEC={delta_dec_arcmin:.2f}' "
+                 f"-> AZ={az_error:.2f}' ALT={alt_error:.2f}'")
+
+    return PAError(
+        az_error=az_error,
+        alt_error=alt_error,
+        total_error=total_error_arcsec
+    )
+
+
+def calculate_pa_error_batch(
+    solved_ra,
+    solved_dec,
+    mount_ra,
+    mount_dec,
+    latitude: float = None
+) -> PAError:
+    """
+    *****
+    Purpose: Calculate the averaged polar alignment error over several plate solves
+
+    Vectorised form of calculate_pa_error for when multiple solves are taken
+    per iteration to average out noise; the trig runs once over the whole
+    array instead of once per sample.
+
+    Parameters:
+    array-like solved_ra: Plate-solved Right Ascensions in degrees
+    array-like solved_dec: Plate-solved Declinations in degrees
+    array-like mount_ra: Mount's reported RA in degrees (scalar or per sample)
+    array-like mount_dec: Mount's reported DEC in degrees (scalar or per sample)
+    float latitude: Observer's latitude in degrees (uses config if None)
+
+    Returns:
+    PAError: Mean polar alignment error across the samples
+    *****
+    """
+    if latitude is None:
+        latitude = config.LATITUDE
+
+    # Broadcast scalar mount positions against the per-sample solves
+    arrays = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (solved_ra, solved_dec, mount_ra, mount_dec))
+    )
+    solved_ra, solved_dec, mount_ra, mount_dec = (np.array(a).ravel() for a in arrays)
+
+    if NUMBA_AVAILABLE:
+        az_error, alt_error, near_pole = _pa_error_batch_core(solved_ra, solved_dec, mount_ra, mount_dec)
+    else:
+        solved_ra = np.radians(solved_ra)
+        solved_dec = np.radians(solved_dec)
+        mount_ra = np.radians(mount_ra)
+        mount_dec = np.radians(mount_dec)
+
+        # Wrap delta_ra to [-pi, pi)
+        delta_ra = np.remainder(solved_ra - mount_ra + math.pi, math.tau) - math.pi
+        delta_dec = solved_dec - mount_dec
+
+        cos_dec = np.cos(mount_dec)
+        near_pole = bool(np.any(cos_dec < 0.1))
+        cos_dec = np.maximum(cos_dec, 0.1)
+
+        az_error = float(np.mean(delta_ra * _DEG_PER_RAD_X_60 / cos_dec))
+        alt_error = float(np.mean(delta_dec * _DEG_PER_RAD_X_60))
+
+    if near_pole:
+        logger.warning("Mount DEC is near the pole (cos_dec < 0.1); AZ error calculation is approximate")
+
+    return PAError(
+        az_error=az_error,
+        alt_error=alt_error,
+        total_error=math.hypot(az_error, alt_error) * 60
+    )
+
+
+@njit(cache=True)
+def _pa_error_core(solved_ra: float, solved_dec: float,
+                   mount_ra: float, mount_dec: float) -> Tuple[float, float, float, float, float, bool]:
+    """
+    *****
+    Purpose: Numeric core of calculate_pa_error (JIT-compiled when numba is installed)
+
+    Parameters:
+    float solved_ra: Plate-solved Right Ascension in degrees
+    float solved_dec: Plate-solved Declination in degrees
+    float mount_ra: Mount's reported RA in degrees
+    float mount_dec: Mount's reported DEC in degrees
+
+    Returns:
+    Tuple: (az_error arcmin, alt_error arcmin, total_error arcsec,
+            delta_ra arcmin, delta_dec arcmin, near_pole flag)
+    *****
+    """
     # Convert to radians
     solved_ra_rad = math.radians(solved_ra)
     solved_dec_rad = math.radians(solved_dec)
@@ -94,15 +216,12 @@ def calculate_pa_error(
     delta_ra = solved_ra_rad - mount_ra_rad
     delta_dec = solved_dec_rad - mount_dec_rad
 
-    # Wrap delta_ra to [-pi, pi]
-    while delta_ra > math.pi:
-        delta_ra -= 2 * math.pi
-    while delta_ra < -math.pi:
-        delta_ra += 2 * math.pi
+    # Wrap delta_ra to [-pi, pi) in one step (numba has no math.remainder)
+    delta_ra -= math.tau * math.floor(delta_ra / math.tau + 0.5)
 
     # Convert to arcminutes
-    delta_ra_arcmin = math.degrees(delta_ra) * 60
-    delta_dec_arcmin = math.degrees(delta_dec) * 60
+    delta_ra_arcmin = delta_ra * _DEG_PER_RAD_X_60
+    delta_dec_arcmin = delta_dec * _DEG_PER_RAD_X_60
 
     # Transform the RA/DEC error to AZ/ALT error
     # This depends on where the mount is pointing and the latitude
@@ -117,9 +236,9 @@ def calculate_pa_error(
     # Simple approximation for equatorial mount PA error:
     # When pointed at celestial pole, the error transformation is straightforward
     cos_dec = math.cos(mount_dec_rad)
-    if cos_dec < 0.1:
+    near_pole = cos_dec < 0.1
+    if near_pole:
         cos_dec = 0.1  # Prevent division issues near pole
-        logger.warning("Mount DEC is near the pole (cos_dec < 0.1); AZ error calculation is approximate")
 
     # Calculate azimuth error component
     # RA error maps to azimuth, scaled by declination
@@ -133,14 +252,38 @@ def calculate_pa_error(
     total_error_arcmin = math.sqrt(az_error**2 + alt_error**2)
     total_error_arcsec = total_error_arcmin * 60
 
-    logger.debug(f"PA Error: dRA={delta_ra_arcmin:.2f}' dDEC={delta_dec_arcmin:.2f}' "
-                 f"-> AZ={az_error:.2f}' ALT={alt_error:.2f}'")
+    return (az_error, alt_error, total_error_arcsec, delta_ra_arcmin, delta_dec_arcmin, near_pole)
 
-    return PAError(
-        az_error=az_error,
-        alt_error=alt_error,
-        total_error=total_error_arcsec
-    )
+
+@njit(cache=True, fastmath=True)
+def _pa_error_batch_core(solved_ra, solved_dec, mount_ra, mount_dec) -> Tuple[float, float, bool]:
+    """
+    *****
+    Purpose: Mean AZ/ALT error over N samples (used when numba is installed)
+
+    Fuses the per-sample core into one compiled loop so no temporary arrays
+    are allocated; without numba the NumPy path is used instead.
+
+    Parameters:
+    ndarray solved_ra: Plate-solved Right Ascensions in degrees
+    ndarray solved_dec: Plate-solved Declinations in degrees
+    ndarray mount_ra: Mount's reported RA in degrees
+    ndarray mount_dec: Mount's reported DEC in degrees
+
+    Returns:
+    Tuple: (mean az_error arcmin, mean alt_error arcmin, any near_pole flag)
+    *****
+    """
+    n = solved_ra.shape[0]
+    az_sum = 0.0
+    alt_sum = 0.0
+    near_pole = False
+    for i in range(n):
+        az, alt, _, _, _, pole = _pa_error_core(solved_ra[i], solved_dec[i], mount_ra[i], mount_dec[i])
+        az_sum += az
+        alt_sum += alt
+        near_pole = near_pole or pole
+    return (az_sum / n, alt_sum / n, near_pole)
 
 
 def parse_ra_string(ra_str: str) -> Optional[float]:
@@ -156,20 +299,25 @@ def parse_ra_string(ra_str: str) -> Optional[float]:
     *****
     """
     try:
-        # Remove any leading/trailing whitespace
-        ra_str = ra_str.strip()
-
         # Parse HH:MM:SS format
-        parts = ra_str.split(':')
-        if len(parts) == 3:
-            hours = int(parts[0])
-            minutes = int(parts[1])
-            seconds = float(parts[2])
+        m = _RA_RE.match(ra_str)
+        if m:
+            hours = int(m.group(1))
+            minutes = int(m.group(2))
+            seconds = float(m.group(3))
 
             # Convert to degrees (1 hour = 15 degrees)
             ra_degrees = (hours + minutes / 60.0 + seconds / 3600.0) * 15.0
             return ra_degrees
 
+        # General HH:MM:SS split for anything the regex does not take
+        parts = ra_str.strip().split(':')
+        if len(parts) == 3:
+            hours = int(parts[0])
+            minutes = int(parts[1])
+            seconds = float(parts[2])
+            return (hours + minutes / 60.0 + seconds / 3600.0) * 15.0
+
         # Try parsing as decimal hours
         ra_hours = float(ra_str)
         return ra_hours * 15.0
@@ -199,25 +347,29 @@ def parse_dec_string(dec_str: str) -> Optional[float]:
             logger.error("Cannot parse DEC: empty string")
             return None
 
-        # Determine sign
-        sign = 1
-        if dec_str[0] == '-':
-            sign = -1
-            dec_str = dec_str[1:]
-        elif dec_str[0] == '+':
-            dec_str = dec_str[1:]
+        # Handle different separators (* or :) in one pass
+        m = _DEC_RE.match(dec_str)
+        if m:
+            sign = -1 if m.group(1) == '-' else 1
+            degrees = int(m.group(2))
+            minutes = int(m.group(3))
+            seconds = float(m.group(4) or 0.0)
 
-        # Handle different separators (* or :)
-        dec_str = dec_str.replace('*', ':').replace("'", ':').replace('"', '')
+            dec_degrees = sign * (degrees + minutes / 60.0 + seconds / 3600.0)
+            return dec_degrees
 
-        parts = dec_str.split(':')
+        # General split for anything the regex does not take (e.g. extra
+        # trailing fields); fields past the seconds are ignored
+        sign = 1
+        if dec_str[0] in '+-':
+            sign = -1 if dec_str[0] == '-' else 1
+            dec_str = dec_str[1:]
+        parts = dec_str.replace('*', ':').replace("'", ':').replace('"', '').split(':')
         if len(parts) >= 2:
             degrees = int(parts[0])
             minutes = int(parts[1])
             seconds = float(parts[2]) if len(parts) > 2 else 0.0
-
-            dec_degrees = sign * (degrees + minutes / 60.0 + seconds / 3600.0)
-            return dec_degrees
+            return sign * (degrees + minutes / 60.0 + seconds / 3600.0)
 
         # Try parsing as decimal degrees
         return float(dec_str) * sign
@@ -273,11 +425,10 @@ def estimate_iterations(current_error: float, target_accuracy: float = None) ->
     # Assume each iteration reduces error by ~50-70%
     # Use 60% as estimate
     reduction_factor = 0.6
-    iterations = 0
-    error = current_error
+    if target_accuracy <= 0 or not math.isfinite(current_error):
+        return 20
 
-    while error > target_accuracy and iterations < 20:
-        error *= reduction_factor
-        iterations += 1
+    # Smallest n with current_error * reduction_factor**n <= target_accuracy
+    iterations = math.ceil(math.log(target_accuracy / current_error) / math.log(reduction_factor))
 
-    return iterations
+    return min(iterations, 20)
@@ -10,12 +10,25 @@ PlateSolver class for astronomical image solving
 *****
 """
 
+import os
+import re
 import math
+import functools
+import threading
 import subprocess
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field, replace
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
 
 try:
     from astropy.io import fits
@@ -29,8 +42,105 @@ import config
 
 logger = logging.getLogger(__name__)
 
+# "KEY=VALUE" lines of an ASTAP .ini result (whitespace around both trimmed)
+_INI_RE = re.compile(rb'^[ \t]*([^=\r\n]+?)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.M)
+
+# WCS header keywords read when turning a solver header into a SolveResult
+_WCS_KEYS = (
+    'NAXIS1', 'NAXIS2', 'IMAGEW', 'IMAGEH', 'CTYPE1', 'CTYPE2', 'CRVAL1', 'CRVAL2',
+    'CRPIX1', 'CRPIX2', 'CD1_1', 'CD1_2', 'CD2_1', 'CD2_2', 'LONPOLE', 'A_ORDER',
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_wcs(header_str: str) -> 'WCS':
+    """
+    *****
+    Purpose: Build (or reuse) a WCS object for a serialized FITS header
+
+    fix=False skips astropy's header "fixing" pass (unit/date/SIP cleanups),
+    which dominates WCS construction time; solver output headers are
+    already well formed. Identical headers reuse the cached object.
+
+    Parameters:
+    str header_str: Header serialized with Header.tostring()
+
+    Returns:
+    WCS: World coordinate system for the header
+    *****
+    """
+    return WCS(fits.Header.fromstring(header_str), fix=False)
+
+
+def _tan_center(header, x: float, y: float) -> Optional[Tuple[float, float]]:
+    """
+    *****
+    Purpose: Convert a pixel position to RA/DEC for a plain TAN (gnomonic) WCS
+
+    Solver output is normally a CD-matrix TAN projection, for which the
+    pixel -> sky transform is a 2x2 affine step plus the closed-form inverse
+    gnomonic projection; no wcslib setup is needed.
+
+    Parameters:
+    Header header: FITS header with CRVAL/CRPIX/CD keywords
+    float x: 0-based pixel x (same convention as WCS.pixel_to_world)
+    float y: 0-based pixel y
+
+    Returns:
+    Tuple[float, float]: (RA, DEC) in degrees, or None if the header is not
+        a simple TAN projection (SIP distortion, PC/CDELT, custom LONPOLE)
+    *****
+    """
+    if header.get('CTYPE1') != 'RA---TAN' or header.get('CTYPE2') != 'DEC--TAN':
+        return None
+    if 'A_ORDER' in header or header.get('LONPOLE', 180) != 180:
+        return None
+    try:
+        cd1_1, cd1_2 = float(header['CD1_1']), float(header.get('CD1_2', 0))
+        cd2_1, cd2_2 = float(header.get('CD2_1', 0)), float(header['CD2_2'])
+        crpix1, crpix2 = float(header['CRPIX1']), float(header['CRPIX2'])
+        ra0, dec0 = math.radians(float(header['CRVAL1'])), math.radians(float(header['CRVAL2']))
+    except (KeyError, ValueError, TypeError):
+        return None
+
+    # FITS pixels are 1-based
+    dx = x + 1 - crpix1
+    dy = y + 1 - crpix2
+    xi = math.radians(cd1_1 * dx + cd1_2 * dy)
+    eta = math.radians(cd2_1 * dx + cd2_2 * dy)
+
+    denom = math.cos(dec0) - eta * math.sin(dec0)
+    ra = math.degrees(ra0 + math.atan2(xi, denom)) % 360.0
+    dec = math.degrees(math.atan2(math.sin(dec0) + eta * math.cos(dec0), math.hypot(xi, denom)))
+    return (ra, dec)
+
 
-@dataclass
+def _decode(output: Optional[bytes]) -> str:
+    """Decode captured solver output for logging."""
+    return output.decode('utf-8', 'replace').strip() if output else ''
+
+
+def _read_header(path: Path) -> 'fits.Header':
+    """Read the header of a small header-only FITS sidecar with one read() (no HDUList/mmap)."""
+    with open(path, 'rb') as f:
+        return fits.Header.fromstring(f.read())
+
+
+def _header_values(header) -> Dict[str, object]:
+    """Copy the keywords used to interpret a solution into a plain dict, looking each up once."""
+    return {k: header[k] for k in _WCS_KEYS if k in header}
+
+
+def _image_center(header, hd: Dict[str, object], naxis1: float, naxis2: float) -> Tuple[float, float]:
+    """Return the (RA, DEC) of the image centre, skipping astropy WCS for plain TAN headers."""
+    center = _tan_center(hd, naxis1 / 2, naxis2 / 2)
+    if center is None:
+        sky = _cached_wcs(header.tostring()).pixel_to_world(naxis1 / 2, naxis2 / 2)
+        center = (float(sky.ra.deg), float(sky.dec.deg))
+    return center
+
+
+@dataclass(frozen=True)
 class SolveResult:
     """
     *****
@@ -44,6 +154,8 @@ class SolveResult:
     float fov_width: Field of view width in degrees
     float fov_height: Field of view height in degrees
     str solver: Which solver produced this result
+    str source_path: Image that was solved (set by PlateSolver.solve)
+    int source_mtime_ns: Modification time of that image when it was solved
 
     Returns:
     SolveResult instance
@@ -56,6 +168,25 @@ class SolveResult:
     fov_width: float  # degrees
     fov_height: float  # degrees
     solver: str
+    source_path: Optional[str] = None
+    source_mtime_ns: Optional[int] = None
+    _ra_hms: str = field(init=False, repr=False, compare=False)
+    _dec_dms: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Format once; the strings are shown on every status poll. The
+        # instance is frozen, so the cached strings can never go stale.
+        # Round to the displayed precision first so seconds never show as 60
+        total_s = round(self.ra * 240, 2) % 86400  # degrees -> seconds of time
+        h, rem = divmod(total_s, 3600)
+        m, s = divmod(rem, 60)
+        object.__setattr__(self, '_ra_hms', f"{int(h):02d}:{int(m):02d}:{s:05.2f}")
+
+        sign = '+' if self.dec >= 0 else '-'
+        total_s = round(abs(self.dec) * 3600, 1)  # degrees -> arcseconds
+        d, rem = divmod(total_s, 3600)
+        m, s = divmod(rem, 60)
+        object.__setattr__(self, '_dec_dms', f"{sign}{int(d):02d}:{int(m):02d}:{s:04.1f}")
 
     def ra_hours(self) -> float:
         """Convert RA to hours."""
@@ -63,20 +194,97 @@ class SolveResult:
 
     def ra_hms(self) -> str:
         """Format RA as HH:MM:SS."""
-        hours = self.ra / 15.0
-        h = int(hours)
-        m = int((hours - h) * 60)
-        s = ((hours - h) * 60 - m) * 60
-        return f"{h:02d}:{m:02d}:{s:05.2f}"
+        return self._ra_hms
 
     def dec_dms(self) -> str:
         """Format DEC as sDD:MM:SS."""
-        sign = '+' if self.dec >= 0 else '-'
-        dec_abs = abs(self.dec)
-        d = int(dec_abs)
-        m = int((dec_abs - d) * 60)
-        s = ((dec_abs - d) * 60 - m) * 60
-        return f"{sign}{d:02d}:{m:02d}:{s:04.1f}"
+        return self._dec_dms
+
+
+class SolveResultsTable:
+    """
+    *****
+    Purpose: Column-wise (structure of arrays) store for a batch of solves
+
+    Each numeric SolveResult field is held in one float64 array, so
+    statistics over many frames (mean position, scatter, drift between
+    frames) are single NumPy operations rather than Python loops over
+    result objects. Rows that failed to solve are NaN; use the solved mask
+    to select the others.
+
+    Parameters:
+    Sequence[str] paths: Image path for each row, in order
+
+    Returns:
+    SolveResultsTable instance with every row unsolved
+    *****
+    """
+
+    _COLUMNS = ('ra', 'dec', 'rotation', 'pixel_scale', 'fov_width', 'fov_height')
+
+    def __init__(self, paths: Sequence[str]):
+        n = len(paths)
+        self.paths: List[str] = list(paths)
+        self.ra = np.full(n, np.nan)
+        self.dec = np.full(n, np.nan)
+        self.rotation = np.full(n, np.nan)
+        self.pixel_scale = np.full(n, np.nan)
+        self.fov_width = np.full(n, np.nan)
+        self.fov_height = np.full(n, np.nan)
+        self.solver: List[Optional[str]] = [None] * n
+        self.source_mtime_ns: List[Optional[int]] = [None] * n
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    @property
+    def solved(self) -> np.ndarray:
+        """Boolean mask of rows holding a solution."""
+        return ~np.isnan(self.ra)
+
+    def set(self, index: int, result: Optional[SolveResult]):
+        """
+        *****
+        Purpose: Store one solve result in the given row
+
+        Parameters:
+        int index: Row to fill
+        SolveResult result: Result to store; None leaves the row unsolved
+
+        Returns:
+        None
+        *****
+        """
+        if result is None:
+            return
+        for name in self._COLUMNS:
+            getattr(self, name)[index] = getattr(result, name)
+        self.solver[index] = result.solver
+        self.source_mtime_ns[index] = result.source_mtime_ns
+
+    def to_list(self) -> List[Optional[SolveResult]]:
+        """
+        *****
+        Purpose: Rebuild SolveResult objects for code that expects them
+
+        Parameters:
+        None
+
+        Returns:
+        List[SolveResult]: One result (or None if unsolved) per row
+        *****
+        """
+        columns = [getattr(self, name).tolist() for name in self._COLUMNS]
+        results = []
+        for i, values in enumerate(zip(*columns)):
+            if self.solver[i] is None:
+                results.append(None)
+                continue
+            results.append(SolveResult(
+                *values, solver=self.solver[i],
+                source_path=self.paths[i], source_mtime_ns=self.source_mtime_ns[i]
+            ))
+        return results
 
 
 class PlateSolver:
@@ -97,9 +305,12 @@ class PlateSolver:
         self.astap_path = config.ASTAP_PATH
         self.astrometry_path = config.ASTROMETRY_PATH
         self.timeout = config.SOLVER_TIMEOUT
+        self.radius = config.SOLVER_RADIUS_DEG
+        self.workers = config.SOLVER_WORKERS
 
     def solve(self, image_path: str, fov_hint: float = None,
-              ra_hint: float = None, dec_hint: float = None) -> Optional[SolveResult]:
+              ra_hint: float = None, dec_hint: float = None,
+              scale_hint: float = None) -> Optional[SolveResult]:
         """
         *****
         Purpose: Plate solve an image
@@ -109,6 +320,7 @@ class PlateSolver:
         float fov_hint: Estimated field of view in degrees
         float ra_hint: Hint RA in degrees (speeds up solving)
         float dec_hint: Hint DEC in degrees (speeds up solving)
+        float scale_hint: Plate scale in arcsec/pixel (speeds up solving)
 
         Returns:
         SolveResult: Solve result or None if failed
@@ -119,14 +331,150 @@ class PlateSolver:
             logger.error(f"Image not found: {image_path}")
             return None
 
+        source_mtime_ns = image_path.stat().st_mtime_ns
+
+        # A sidecar written after the image was last modified is this image's
+        # solution; parse it instead of running the solver again
+        result = self._reuse_sidecar(image_path, source_mtime_ns)
+        if result is None:
+            if self.solver == 'astap':
+                if fov_hint is None and scale_hint:
+                    fov_hint = self._fov_from_scale(image_path, scale_hint)
+                result = self._solve_astap(image_path, fov_hint, ra_hint, dec_hint)
+            elif self.solver == 'astrometry':
+                result = self._solve_astrometry(image_path, fov_hint, ra_hint, dec_hint, scale_hint)
+            else:
+                logger.error(f"Unknown solver: {self.solver}")
+                return None
+
+        if result:
+            result = replace(result, source_path=str(image_path), source_mtime_ns=source_mtime_ns)
+        return result
+
+    def _reuse_sidecar(self, image_path: Path, image_mtime_ns: int) -> Optional[SolveResult]:
+        """
+        *****
+        Purpose: Return the solution left by an earlier solve of this image
+
+        Parameters:
+        Path image_path: Image being solved
+        int image_mtime_ns: Modification time of the image
+
+        Returns:
+        SolveResult: Parsed sidecar result, or None if there is no fresh sidecar
+        *****
+        """
+        wcs_path = image_path.with_suffix('.wcs')
+        try:
+            if os.stat(wcs_path).st_mtime_ns < image_mtime_ns:
+                return None
+        except OSError:
+            return None
+
         if self.solver == 'astap':
-            return self._solve_astap(image_path, fov_hint, ra_hint, dec_hint)
-        elif self.solver == 'astrometry':
-            return self._solve_astrometry(image_path, fov_hint, ra_hint, dec_hint)
+            result = self._parse_astap_result(wcs_path, wcs_path.with_suffix('.ini'))
+        elif self.solver == 'astrometry' and wcs_path.with_suffix('.solved').exists():
+            result = self._parse_astrometry_result(wcs_path)
         else:
-            logger.error(f"Unknown solver: {self.solver}")
             return None
 
+        if result:
+            logger.debug("Reusing existing solution for %s", image_path.name)
+        return result
+
+    def solve_batch(self, image_paths: Iterable[str], fov_hint: float = None,
+                    ra_hint: float = None, dec_hint: float = None,
+                    scale_hint: float = None, n_workers: int = None) -> Dict[str, Optional[SolveResult]]:
+        """
+        *****
+        Purpose: Plate solve several images concurrently
+
+        Each solve is an external process, so a small thread pool keeps up to
+        n_workers solvers busy while the others parse their WCS output.
+        Sidecar files are named after each image, so distinct paths never
+        collide; duplicate paths are solved once.
+
+        Parameters:
+        Iterable[str] image_paths: Paths to image files
+        float fov_hint: Estimated field of view in degrees
+        float ra_hint: Hint RA in degrees (shared by all images)
+        float dec_hint: Hint DEC in degrees (shared by all images)
+        float scale_hint: Plate scale in arcsec/pixel
+        int n_workers: Concurrent solves (uses config.SOLVER_WORKERS if None)
+
+        Returns:
+        Dict[str, SolveResult]: Result (or None) per path, in input order
+        *****
+        """
+        paths = list(dict.fromkeys(str(p) for p in image_paths))
+        if not paths:
+            return {}
+        if n_workers is None:
+            n_workers = self.workers
+        n_workers = max(1, min(n_workers, len(paths)))
+
+        def _solve(path):
+            return self.solve(path, fov_hint=fov_hint, ra_hint=ra_hint,
+                              dec_hint=dec_hint, scale_hint=scale_hint)
+
+        with ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix='solver') as pool:
+            return dict(zip(paths, pool.map(_solve, paths)))
+
+    def solve_batch_table(self, image_paths: Iterable[str], fov_hint: float = None,
+                          ra_hint: float = None, dec_hint: float = None,
+                          scale_hint: float = None, n_workers: int = None) -> SolveResultsTable:
+        """
+        *****
+        Purpose: Plate solve several images into a column-wise results table
+
+        Same as solve_batch(), but the results are stored in NumPy arrays
+        for vectorized statistics across frames.
+
+        Parameters:
+        Iterable[str] image_paths: Paths to image files
+        float fov_hint: Estimated field of view in degrees
+        float ra_hint: Hint RA in degrees (shared by all images)
+        float dec_hint: Hint DEC in degrees (shared by all images)
+        float scale_hint: Plate scale in arcsec/pixel
+        int n_workers: Concurrent solves (uses config.SOLVER_WORKERS if None)
+
+        Returns:
+        SolveResultsTable: One row per distinct path, in input order
+        *****
+        """
+        results = self.solve_batch(image_paths, fov_hint=fov_hint, ra_hint=ra_hint,
+                                   dec_hint=dec_hint, scale_hint=scale_hint,
+                                   n_workers=n_workers)
+        table = SolveResultsTable(list(results))
+        for i, result in enumerate(results.values()):
+            table.set(i, result)
+        return table
+
+    def _fov_from_scale(self, image_path: Path, scale_hint: float) -> Optional[float]:
+        """
+        *****
+        Purpose: Convert a plate scale hint into ASTAP's field-height hint
+
+        Only the image header is read to get the height.
+
+        Parameters:
+        Path image_path: Image being solved
+        float scale_hint: Plate scale in arcsec/pixel
+
+        Returns:
+        float: Field height in degrees, or None if the image size is unknown
+        *****
+        """
+        if not PIL_AVAILABLE:
+            return None
+        try:
+            with Image.open(image_path) as img:
+                height = img.height
+        except OSError as e:
+            logger.warning(f"Cannot read image size for FOV hint: {e}")
+            return None
+        return height * scale_hint / 3600
+
     def _solve_astap(self, image_path: Path, fov_hint: float,
                      ra_hint: float, dec_hint: float) -> Optional[SolveResult]:
         """Solve using ASTAP."""
@@ -134,7 +482,7 @@ class PlateSolver:
         cmd = [
             self.astap_path,
             '-f', str(image_path),
-            '-r', '30',  # Search radius in degrees
+            '-r', str(self.radius),  # Search radius in degrees
             '-z', '0',   # Downsample (0 = auto)
         ]
 
@@ -147,31 +495,36 @@ class PlateSolver:
             cmd.extend(['-ra', str(ra_hint / 15.0)])  # ASTAP uses hours
             cmd.extend(['-spd', str(dec_hint + 90)])  # South Pole Distance
 
-        logger.info(f"Running ASTAP: {' '.join(cmd)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Running ASTAP: %s", ' '.join(cmd))
 
         # Delete any stale .wcs file so a prior result cannot be mistaken for a fresh one
         wcs_path = image_path.with_suffix('.wcs')
-        ini_path = image_path.with_suffix('.ini')
-        if wcs_path.exists():
+        ini_path = wcs_path.with_suffix('.ini')
+        try:
             wcs_path.unlink()
+        except FileNotFoundError:
+            pass
 
         try:
+            # Solver stdout is verbose and never used; keep stderr as raw bytes
+            # and only decode it if the solve fails
             result = subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=self.timeout
             )
 
             if result.returncode != 0:
-                logger.warning(f"ASTAP returned non-zero exit code {result.returncode}: {result.stderr}")
+                logger.warning(f"ASTAP returned non-zero exit code {result.returncode}: {_decode(result.stderr)}")
                 return None
 
             # Check for .wcs file (indicates success)
             if wcs_path.exists():
                 return self._parse_astap_result(wcs_path, ini_path)
             else:
-                logger.warning(f"ASTAP failed: {result.stderr}")
+                logger.warning(f"ASTAP failed: {_decode(result.stderr)}")
                 return None
 
         except subprocess.TimeoutExpired:
@@ -185,47 +538,41 @@ class PlateSolver:
         """Parse ASTAP output files."""
         try:
             # Parse INI file for additional info
-            ini_data = {}
-            if ini_path.exists():
-                with open(ini_path, 'r') as f:
-                    for line in f:
-                        if '=' in line:
-                            key, value = line.strip().split('=', 1)
-                            ini_data[key.strip()] = value.strip()
+            try:
+                ini_bytes = ini_path.read_bytes()
+            except FileNotFoundError:
+                ini_bytes = b''
+            ini_data = {k.decode(): v.decode() for k, v in _INI_RE.findall(ini_bytes)}
 
             # Parse WCS file
             if ASTROPY_AVAILABLE:
-                with fits.open(wcs_path) as hdul:
-                    header = hdul[0].header
-                    wcs = WCS(header)
-
-                    # Get center coordinates
-                    naxis1 = header.get('NAXIS1', header.get('IMAGEW', 1920))
-                    naxis2 = header.get('NAXIS2', header.get('IMAGEH', 1080))
-                    center = wcs.pixel_to_world(naxis1 / 2, naxis2 / 2)
-
-                    ra = center.ra.deg
-                    dec = center.dec.deg
-
-                    # Get rotation and scale
-                    cd1_1 = header.get('CD1_1', 0)
-                    cd2_1 = header.get('CD2_1', 0)
-
-                    pixel_scale = math.sqrt(cd1_1**2 + cd2_1**2) * 3600  # arcsec/pixel
-                    rotation = math.degrees(math.atan2(cd2_1, cd1_1))
-
-                    fov_width = naxis1 * pixel_scale / 3600
-                    fov_height = naxis2 * pixel_scale / 3600
-
-                    return SolveResult(
-                        ra=ra,
-                        dec=dec,
-                        rotation=rotation,
-                        pixel_scale=pixel_scale,
-                        fov_width=fov_width,
-                        fov_height=fov_height,
-                        solver='astap'
-                    )
+                header = _read_header(wcs_path)
+                hd = _header_values(header)
+
+                # Get center coordinates
+                naxis1 = hd.get('NAXIS1', hd.get('IMAGEW', 1920))
+                naxis2 = hd.get('NAXIS2', hd.get('IMAGEH', 1080))
+                ra, dec = _image_center(header, hd, naxis1, naxis2)
+
+                # Get rotation and scale
+                cd1_1 = hd.get('CD1_1', 0)
+                cd2_1 = hd.get('CD2_1', 0)
+
+                pixel_scale = math.sqrt(cd1_1**2 + cd2_1**2) * 3600  # arcsec/pixel
+                rotation = math.degrees(math.atan2(cd2_1, cd1_1))
+
+                fov_width = naxis1 * pixel_scale / 3600
+                fov_height = naxis2 * pixel_scale / 3600
+
+                return SolveResult(
+                    ra=ra,
+                    dec=dec,
+                    rotation=rotation,
+                    pixel_scale=pixel_scale,
+                    fov_width=fov_width,
+                    fov_height=fov_height,
+                    solver='astap'
+                )
             else:
                 # Parse without astropy (basic parsing)
                 crval1 = float(ini_data.get('CRVAL1', 0))
@@ -246,7 +593,8 @@ class PlateSolver:
             return None
 
     def _solve_astrometry(self, image_path: Path, fov_hint: float,
-                          ra_hint: float, dec_hint: float) -> Optional[SolveResult]:
+                          ra_hint: float, dec_hint: float,
+                          scale_hint: float = None) -> Optional[SolveResult]:
         """Solve using astrometry.net."""
         # Build command
         cmd = [
@@ -256,6 +604,17 @@ class PlateSolver:
             '--overwrite',
             '--no-remove-lines',
             '--uniformize', '0',
+            # Give up on our own before the subprocess timeout kills solve-field,
+            # which would leave its astrometry-engine child running
+            '--cpulimit', str(max(1, int(self.timeout) - 5)),
+            # Only the .solved flag and .wcs header are read back; skip
+            # writing the other outputs and re-verifying input WCS headers
+            '--no-verify',
+            '--new-fits', 'none',
+            '--match', 'none',
+            '--rdls', 'none',
+            '--corr', 'none',
+            '--index-xyls', 'none',
         ]
 
         # Add scale hint if FOV provided
@@ -264,31 +623,37 @@ class PlateSolver:
             high = fov_hint * 1.2
             cmd.extend(['--scale-low', str(low), '--scale-high', str(high)])
             cmd.extend(['--scale-units', 'degwidth'])
+        elif scale_hint:
+            cmd.extend(['--scale-low', str(scale_hint * 0.9), '--scale-high', str(scale_hint * 1.1)])
+            cmd.extend(['--scale-units', 'arcsecperpix'])
 
         # Add position hint
         if ra_hint is not None and dec_hint is not None:
             cmd.extend(['--ra', str(ra_hint)])
             cmd.extend(['--dec', str(dec_hint)])
-            cmd.extend(['--radius', '30'])
+            cmd.extend(['--radius', str(self.radius)])
 
-        logger.info(f"Running astrometry.net: {' '.join(cmd)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Running astrometry.net: %s", ' '.join(cmd))
 
         try:
+            # Solver stdout is verbose and never used; keep stderr as raw bytes
+            # and only decode it if the solve fails
             result = subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=self.timeout
             )
 
             # Check for .solved file
-            solved_path = image_path.with_suffix('.solved')
             wcs_path = image_path.with_suffix('.wcs')
+            solved_path = wcs_path.with_suffix('.solved')
 
             if solved_path.exists() and wcs_path.exists():
                 return self._parse_astrometry_result(wcs_path)
             else:
-                logger.warning(f"astrometry.net failed: {result.stderr}")
+                logger.warning(f"astrometry.net failed: {_decode(result.stderr)}")
                 return None
 
         except subprocess.TimeoutExpired:
@@ -305,35 +670,30 @@ class PlateSolver:
             return None
 
         try:
-            with fits.open(wcs_path) as hdul:
-                header = hdul[0].header
-                wcs = WCS(header)
-
-                naxis1 = header.get('NAXIS1', header.get('IMAGEW', 1920))
-                naxis2 = header.get('NAXIS2', header.get('IMAGEH', 1080))
-                center = wcs.pixel_to_world(naxis1 / 2, naxis2 / 2)
-
-                ra = center.ra.deg
-                dec = center.dec.deg
-
-                cd1_1 = header.get('CD1_1', 0)
-                cd2_1 = header.get('CD2_1', 0)
-
-                pixel_scale = math.sqrt(cd1_1**2 + cd2_1**2) * 3600
-                rotation = math.degrees(math.atan2(cd2_1, cd1_1))
-
-                fov_width = naxis1 * pixel_scale / 3600
-                fov_height = naxis2 * pixel_scale / 3600
-
-                return SolveResult(
-                    ra=ra,
-                    dec=dec,
-                    rotation=rotation,
-                    pixel_scale=pixel_scale,
-                    fov_width=fov_width,
-                    fov_height=fov_height,
-                    solver='astrometry'
-                )
+            header = _read_header(wcs_path)
+            hd = _header_values(header)
+            naxis1 = hd.get('NAXIS1', hd.get('IMAGEW', 1920))
+            naxis2 = hd.get('NAXIS2', hd.get('IMAGEH', 1080))
+            ra, dec = _image_center(header, hd, naxis1, naxis2)
+
+            cd1_1 = hd.get('CD1_1', 0)
+            cd2_1 = hd.get('CD2_1', 0)
+
+            pixel_scale = math.sqrt(cd1_1**2 + cd2_1**2) * 3600
+            rotation = math.degrees(math.atan2(cd2_1, cd1_1))
+
+            fov_width = naxis1 * pixel_scale / 3600
+            fov_height = naxis2 * pixel_scale / 3600
+
+            return SolveResult(
+                ra=ra,
+                dec=dec,
+                rotation=rotation,
+                pixel_scale=pixel_scale,
+                fov_width=fov_width,
+                fov_height=fov_height,
+                solver='astrometry'
+            )
 
         except Exception as e:
             logger.error(f"Error parsing astrometry.net result: {e}")
@@ -360,6 +720,7 @@ class PlateSolver:
 
 # Singleton instance
 _plate_solver = None
+_plate_solver_lock = threading.Lock()
 
 def get_plate_solver() -> PlateSolver:
     """
@@ -375,5 +736,8 @@ def get_plate_solver() -> PlateSolver:
     """
     global _plate_solver
     if _plate_solver is None:
-        _plate_solver = PlateSolver()
+        # Web requests and the alignment loop may race to create it
+        with _plate_solver_lock:
+            if _plate_solver is None:
+                _plate_solver = PlateSolver()
     return _plate_solver
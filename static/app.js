@@ -83,7 +83,10 @@ function initWebSocket() {
     });
 
     socket.on('status', (data) => {
-        addStatusLog(data.message, data.level);
+        // Server batches messages emitted within a short window
+        (data.messages || [data]).forEach((msg) => {
+            addStatusLog(msg.message, msg.level);
+        });
     });
 
     socket.on('status_update', (data) => {
@@ -43,6 +43,9 @@ def mock_config(monkeypatch, tmp_path):
     monkeypatch.setattr(config, "ASTAP_PATH", "/tmp/fake_astap")
     monkeypatch.setattr(config, "ASTROMETRY_PATH", "/tmp/fake_solve-field")
     monkeypatch.setattr(config, "SOLVER_TIMEOUT", 10)
+    monkeypatch.setattr(config, "SOLVER_RADIUS_DEG", 30)
+    monkeypatch.setattr(config, "SOLVER_WORKERS", 2)
+    monkeypatch.setattr(config, "PLATE_SCALE_ARCSEC_PER_PX", None)
 
     # Capture defaults
     monkeypatch.setattr(config, "DEFAULT_EXPOSURE", 1.0)
@@ -63,6 +66,7 @@ def mock_config(monkeypatch, tmp_path):
 
     # File paths
     monkeypatch.setattr(config, "CAPTURE_DIR", str(capture_dir))
+    monkeypatch.setattr(config, "CAPTURE_RETENTION", 3600)
 
     # Web server settings
     monkeypatch.setattr(config, "WEB_HOST", "127.0.0.1")
@@ -126,14 +130,10 @@ def mock_serial():
 def _ensure_app_imported():
     """
     *****
-    Purpose: Import the app module safely by forcing SocketIO to use
-    the 'threading' async mode instead of 'eventlet', which is not
-    installed in the test environment.
+    Purpose: Import the app module once and return it.
 
-    The app module is only imported once (cached in sys.modules).
-    This helper patches flask_socketio.SocketIO.__init__ on the first
-    import so the module-level SocketIO(..., async_mode='eventlet')
-    call succeeds without eventlet being installed.
+    The app module is only imported once (cached in sys.modules), so the
+    module-level Flask and SocketIO objects are shared across tests.
 
     Parameters:
     None
@@ -142,36 +142,7 @@ def _ensure_app_imported():
     module: the imported app module
     *****
     """
-    import sys
-    if "app" in sys.modules:
-        return sys.modules["app"]
-
-    import flask_socketio
-    _orig_init = flask_socketio.SocketIO.__init__
-
-    def _patched_init(self, *args, **kwargs):
-        """
-        *****
-        Purpose: Wrapper that replaces async_mode='eventlet' with
-        'threading' so tests can run without eventlet installed.
-
-        Parameters:
-        SocketIO self: the SocketIO instance being initialised
-        args: positional arguments forwarded to original __init__
-        kwargs: keyword arguments forwarded to original __init__
-
-        Returns:
-        None
-        *****
-        """
-        kwargs["async_mode"] = "threading"
-        return _orig_init(self, *args, **kwargs)
-
-    flask_socketio.SocketIO.__init__ = _patched_init
-    try:
-        import app as app_module
-    finally:
-        flask_socketio.SocketIO.__init__ = _orig_init
+    import app as app_module
 
     return app_module
 
@@ -14,6 +14,8 @@ None
 """
 
 import json
+import os
+from unittest.mock import patch
 
 
 # ============================================================================
@@ -114,6 +116,69 @@ class TestStatusRoute:
         data = json.loads(response.data)
         assert data["mount_connected"] is False
 
+    def test_status_reports_last_solve_fragment(self, client):
+        """
+        *****
+        Purpose: After a solve result is published, /api/status should
+        return its preformatted RA/DEC strings under 'last_solve'.
+
+        Parameters:
+        FlaskClient client: Flask test client fixture
+
+        Returns:
+        None
+        *****
+        """
+        import app as app_module
+        from plate_solver import SolveResult
+
+        result = SolveResult(
+            ra=180.0, dec=45.5, rotation=0.0, pixel_scale=1.0,
+            fov_width=1.0, fov_height=1.0, solver="astap",
+        )
+        app_module.set_last_solve_result(result)
+        try:
+            response = client.get("/api/status")
+            data = json.loads(response.data)
+            assert data["last_solve"]["ra_hms"] == "12:00:00.00"
+            assert data["last_solve"]["dec_dms"] == "+45:30:00.0"
+        finally:
+            app_module.update_state(solve=None, solve_status=None)
+
+    def test_status_serializes_numpy_solve_values(self, client):
+        """
+        *****
+        Purpose: A solve result holding NumPy scalars (as returned by the
+        astropy WCS fallback) should still serialize in /api/status and in
+        Socket.IO packets.
+
+        Parameters:
+        FlaskClient client: Flask test client fixture
+
+        Returns:
+        None
+        *****
+        """
+        import numpy as np
+        import app as app_module
+        from plate_solver import SolveResult
+
+        result = SolveResult(
+            ra=np.float64(180.0), dec=np.float64(45.5), rotation=0.0, pixel_scale=1.0,
+            fov_width=1.0, fov_height=1.0, solver="astap",
+        )
+        status = app_module.set_last_solve_result(result)
+        try:
+            response = client.get("/api/status")
+            assert response.status_code == 200
+            data = json.loads(response.data)
+            assert data["last_solve"]["ra"] == 180.0
+            if app_module.ORJSON_AVAILABLE:
+                packet = app_module.OrjsonSocketCodec.dumps(status)
+                assert json.loads(packet)["dec"] == 45.5
+        finally:
+            app_module.update_state(solve=None, solve_status=None)
+
 
 # ============================================================================
 # Settings Route
@@ -287,3 +352,426 @@ class TestLocationsRoute:
         response = client.get("/api/locations")
         data = json.loads(response.data)
         assert isinstance(data, dict)
+
+
+# ============================================================================
+# Solve Route
+# ============================================================================
+
+class TestSolveRoute:
+    """
+    *****
+    Purpose: Verify the /api/solve endpoint's choice of image when no
+    filepath is supplied.
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    *****
+    """
+
+    def test_solve_without_captures_returns_400(self, client):
+        """
+        *****
+        Purpose: POST /api/solve with no filepath, no capture this session and
+        an empty capture directory should return HTTP 400.
+
+        Parameters:
+        FlaskClient client: Flask test client fixture
+
+        Returns:
+        None
+        *****
+        """
+        response = client.post(
+            "/api/solve",
+            data=json.dumps({}),
+            content_type="application/json",
+        )
+        assert response.status_code == 400
+
+    def test_solve_uses_last_capture_path(self, client, tmp_path):
+        """
+        *****
+        Purpose: POST /api/solve with no filepath should solve the camera's
+        last captured image rather than scanning the capture directory.
+
+        Parameters:
+        FlaskClient client: Flask test client fixture
+        pathlib.Path tmp_path: pytest fixture providing a unique temporary directory
+
+        Returns:
+        None
+        *****
+        """
+        import camera_client
+        import plate_solver
+
+        image = tmp_path / "elsewhere.png"
+        image.write_text("dummy")
+        camera_client.get_camera_client().last_capture_path = str(image)
+
+        with patch.object(plate_solver.PlateSolver, "solve", return_value=None) as solve:
+            response = client.post(
+                "/api/solve",
+                data=json.dumps({}),
+                content_type="application/json",
+            )
+
+        assert response.status_code == 500
+        assert solve.call_args[0][0] == str(image)
+
+    def test_solve_falls_back_to_newest_capture_on_disk(self, client, mock_config):
+        """
+        *****
+        Purpose: With no capture this session, POST /api/solve should pick
+        a capture_*.png from CAPTURE_DIR and ignore other files there
+        (ctime ordering cannot be forced from a test).
+
+        Parameters:
+        FlaskClient client: Flask test client fixture
+        pathlib.Path mock_config: the temporary CAPTURE_DIR
+
+        Returns:
+        None
+        *****
+        """
+        import plate_solver
+
+        older = mock_config / "capture_1.png"
+        newer = mock_config / "capture_2.png"
+        other = mock_config / "notes.png"
+        for path in (older, newer, other):
+            path.write_text("dummy")
+
+        with patch.object(plate_solver.PlateSolver, "solve", return_value=None) as solve:
+            client.post(
+                "/api/solve",
+                data=json.dumps({}),
+                content_type="application/json",
+            )
+
+        assert solve.call_args[0][0] in (str(older), str(newer))
+
+    def test_solve_reuses_result_for_unchanged_image(self, client, tmp_path):
+        """
+        *****
+        Purpose: Solving the same unchanged image twice should run the
+        solver only once and return the cached result the second time.
+
+        Parameters:
+        FlaskClient client: Flask test client fixture
+        pathlib.Path tmp_path: pytest fixture providing a unique temporary directory
+
+        Returns:
+        None
+        *****
+        """
+        import app as app_module
+        import plate_solver
+
+        image = tmp_path / "capture_1.png"
+        image.write_text("dummy")
+        result = plate_solver.SolveResult(
+            ra=180.0, dec=45.5, rotation=0.0, pixel_scale=1.0,
+            fov_width=1.0, fov_height=1.0, solver="astap",
+        )
+
+        try:
+            with patch.object(plate_solver.PlateSolver, "_solve_astap", return_value=result) as solve:
+                for _ in range(2):
+                    response = client.post(
+                        "/api/solve",
+                        data=json.dumps({"filepath": str(image)}),
+                        content_type="application/json",
+                    )
+                    assert response.status_code == 200
+            assert solve.call_count == 1
+        finally:
+            app_module.update_state(solve=None, solve_status=None)
+
+
+# ============================================================================
+# Status Batching
+# ============================================================================
+
+class TestStatusBatching:
+    """
+    *****
+    Purpose: Verify emit_status() messages reach Socket.IO clients batched,
+    in order and without being dropped.
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    *****
+    """
+
+    @staticmethod
+    def wait_for_flusher_exit(app_module):
+        """
+        *****
+        Purpose: Wait until no status flusher task is running
+
+        Parameters:
+        module app_module: the imported app module
+
+        Returns:
+        None
+        *****
+        """
+        import time
+
+        deadline = time.monotonic() + 2.0
+        while app_module._status_flusher is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert app_module._status_flusher is None
+
+    def test_burst_arrives_as_one_ordered_payload(self, client):
+        """
+        *****
+        Purpose: Messages emitted back to back should arrive as a single
+        {'messages': [...]} payload in emit order, and the flusher task
+        should exit once the queue is drained.
+
+        Parameters:
+        FlaskClient client: Flask test client fixture
+
+        Returns:
+        None
+        *****
+        """
+        import app as app_module
+
+        self.wait_for_flusher_exit(app_module)
+        sio = app_module.socketio.test_client(app_module.app)
+        try:
+            sio.get_received()
+            texts = [f"step {i}" for i in range(20)]
+            for text in texts:
+                app_module.emit_status(text, 'info')
+            self.wait_for_flusher_exit(app_module)
+
+            payloads = [p["args"][0] for p in sio.get_received() if p["name"] == "status"]
+        finally:
+            sio.disconnect()
+
+        assert len(payloads) == 1
+        assert [m["message"] for m in payloads[0]["messages"]] == texts
+
+
+# ============================================================================
+# Auto-Align Loop
+# ============================================================================
+
+class TestAutoAlignLoop:
+    """
+    *****
+    Purpose: Verify the align loop only exposes a frame during a solve
+    after a failed solve, and only publishes it as the latest capture when
+    the loop uses it.
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    *****
+    """
+
+    @staticmethod
+    def run_loop(camera, solve_results, monkeypatch):
+        """
+        *****
+        Purpose: Run auto_align_loop against a fake camera backend, mount and
+        solver, with one iteration per entry in solve_results
+
+        Parameters:
+        CameraClient camera: client whose OpenCV capture is faked
+        list solve_results: SolveResult (or None) returned by each solve
+        monkeypatch monkeypatch: pytest monkeypatch fixture
+
+        Returns:
+        unittest.mock.MagicMock: the fake plate solver
+        *****
+        """
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest.mock import MagicMock
+        import app as app_module
+        import config
+
+        monkeypatch.setattr(config, "MAX_ITERATIONS", len(solve_results))
+        camera._connected = True
+
+        def fake_capture(filepath, exposure, gain):
+            filepath.write_text("frame")
+            return str(filepath)
+
+        mount = MagicMock()
+        mount.get_position.return_value = ("06:30:00", "+45*00:00")
+        solver = MagicMock()
+        solver.solve.side_effect = solve_results
+        fake_time = MagicMock(wraps=time)
+        fake_time.sleep = lambda seconds: None
+        pools = []
+
+        def make_pool(*args, **kwargs):
+            pools.append(ThreadPoolExecutor(*args, **kwargs))
+            return pools[-1]
+
+        app_module.update_state(running=True)
+        try:
+            with patch.object(camera, "_capture_opencv", side_effect=fake_capture), \
+                 patch.object(app_module, "get_mount_client", return_value=mount), \
+                 patch.object(app_module, "get_plate_solver", return_value=solver), \
+                 patch.object(app_module, "ThreadPoolExecutor", side_effect=make_pool), \
+                 patch.object(app_module, "time", fake_time):
+                app_module.auto_align_loop(target_accuracy=1.0)
+                # The loop does not wait for a discarded exposure; let it finish
+                for pool in pools:
+                    pool.shutdown(wait=True)
+        finally:
+            app_module.update_state(running=False, solve=None, solve_status=None,
+                                    pa_error=None, pa_error_status=None)
+        return solver
+
+    @staticmethod
+    def off_target_result():
+        """
+        *****
+        Purpose: Build a solve result far enough from the mount position
+        that the loop applies a correction
+
+        Parameters:
+        None
+
+        Returns:
+        SolveResult: the off-target result
+        *****
+        """
+        from plate_solver import SolveResult
+
+        return SolveResult(
+            ra=98.0, dec=46.0, rotation=0.0, pixel_scale=1.0,
+            fov_width=1.0, fov_height=1.0, solver="astap",
+        )
+
+    def test_no_prefetch_after_successful_solve(self, client, mock_config, monkeypatch):
+        """
+        *****
+        Purpose: An iteration whose solve succeeds should expose only the
+        frame it solves, with no speculative capture.
+
+        Parameters:
+        FlaskClient client: Flask test client fixture
+        pathlib.Path mock_config: the temporary CAPTURE_DIR
+        monkeypatch monkeypatch: pytest monkeypatch fixture
+
+        Returns:
+        None
+        *****
+        """
+        import camera_client
+
+        camera = camera_client.get_camera_client()
+        solver = self.run_loop(camera, [self.off_target_result()], monkeypatch)
+
+        used = solver.solve.call_args[0][0]
+        assert camera.last_capture_path == used
+        assert [p.name for p in mock_config.iterdir()] == [os.path.basename(used)]
+
+    def test_prefetch_after_failed_solve(self, client, mock_config, monkeypatch):
+        """
+        *****
+        Purpose: After a failed solve the next frame should be exposed during
+        the solve, reused if that solve fails too, and deleted (never
+        published) once a correction is applied.
+
+        Parameters:
+        FlaskClient client: Flask test client fixture
+        pathlib.Path mock_config: the temporary CAPTURE_DIR
+        monkeypatch monkeypatch: pytest monkeypatch fixture
+
+        Returns:
+        None
+        *****
+        """
+        import camera_client
+
+        camera = camera_client.get_camera_client()
+        with patch.object(camera, "capture", wraps=camera.capture) as capture:
+            solver = self.run_loop(camera, [None, None, self.off_target_result()], monkeypatch)
+
+        solved = [c[0][0] for c in solver.solve.call_args_list]
+        prefetches = [c for c in capture.call_args_list if c.kwargs.get("publish") is False]
+        assert capture.call_count == 4
+        assert len(prefetches) == 2
+        assert camera.last_capture_path == solved[2]
+
+        # The frame exposed during the final solve is deleted once captured
+        assert sorted(p.name for p in mock_config.iterdir()) == sorted(os.path.basename(p) for p in solved)
+
+
+# ============================================================================
+# Request Validation
+# ============================================================================
+
+class TestRequestValidation:
+    """
+    *****
+    Purpose: Verify numeric request fields are validated before any
+    hardware is touched.
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    *****
+    """
+
+    def test_capture_rejects_non_integer_gain(self, client):
+        """
+        *****
+        Purpose: POST /api/capture with a non-numeric gain should return
+        HTTP 400 naming the offending field.
+
+        Parameters:
+        FlaskClient client: Flask test client fixture
+
+        Returns:
+        None
+        *****
+        """
+        response = client.post(
+            "/api/capture",
+            data=json.dumps({"exposure": 1.5, "gain": "high"}),
+            content_type="application/json",
+        )
+        assert response.status_code == 400
+        assert json.loads(response.data)["error"] == "gain must be an integer"
+
+    def test_move_az_rejects_non_numeric_arcmin(self, client):
+        """
+        *****
+        Purpose: POST /api/move-az with a non-numeric arcmin should return
+        HTTP 400.
+
+        Parameters:
+        FlaskClient client: Flask test client fixture
+
+        Returns:
+        None
+        *****
+        """
+        response = client.post(
+            "/api/move-az",
+            data=json.dumps({"arcmin": "left"}),
+            content_type="application/json",
+        )
+        assert response.status_code == 400
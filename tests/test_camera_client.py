@@ -0,0 +1,301 @@
+"""
+*****
+Purpose: Unit tests for the camera_client module
+
+Covers the on-demand preview grabber of the OpenCV backend against a fake
+cv2 module, and V4L2 device discovery against a faked /dev and QUERYCAP
+ioctl, without touching real camera hardware.
+
+Parameters:
+None
+
+Returns:
+None
+*****
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+import camera_client
+from camera_client import CameraClient
+
+
+@pytest.fixture
+def fake_cv2():
+    """
+    *****
+    Purpose: Install a fake cv2 module whose VideoCapture yields small frames
+
+    Parameters:
+    None
+
+    Returns:
+    unittest.mock.MagicMock: the fake cv2 module
+    *****
+    """
+    cv2 = MagicMock()
+    camera = cv2.VideoCapture.return_value
+    camera.isOpened.return_value = True
+    camera.get.side_effect = lambda prop: {cv2.CAP_PROP_FRAME_WIDTH: 8, cv2.CAP_PROP_FRAME_HEIGHT: 6}.get(prop, 0)
+    camera.grab.return_value = True
+    camera.retrieve.side_effect = lambda buf=None: (True, np.zeros((6, 8, 3), dtype=np.uint8))
+    cv2.resize.side_effect = lambda frame, size, **kwargs: np.zeros((size[1], size[0], 3), dtype=np.uint8)
+    cv2.imencode.return_value = (True, np.frombuffer(b"jpeg", dtype=np.uint8))
+
+    with patch.object(camera_client, "cv2", cv2, create=True), \
+         patch.object(camera_client, "np", np, create=True), \
+         patch.object(camera_client, "CV2_AVAILABLE", True):
+        yield cv2
+
+
+@pytest.fixture
+def camera(fake_cv2):
+    """
+    *****
+    Purpose: Provide a CameraClient connected to the fake OpenCV camera
+
+    Parameters:
+    unittest.mock.MagicMock fake_cv2: the fake cv2 module
+
+    Returns:
+    CameraClient: a connected client, disconnected again after the test
+    *****
+    """
+    client = CameraClient()
+    assert client.connect('opencv', '0')
+    yield client
+    client.disconnect()
+
+
+# ===========================================================================
+# TestPreviewGrabber
+# ===========================================================================
+
+
+class TestPreviewGrabber:
+    """
+    *****
+    Purpose: Verify the preview grabber thread only runs while previews are
+    being requested
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    *****
+    """
+
+    def test_connect_does_not_start_grabber(self, camera, fake_cv2):
+        """
+        *****
+        Purpose: Connecting alone should not start the grabber or read frames
+
+        Parameters:
+        CameraClient camera: connected fixture client
+        unittest.mock.MagicMock fake_cv2: the fake cv2 module
+
+        Returns:
+        None
+        *****
+        """
+        time.sleep(0.05)
+        assert camera._grabber_thread is None
+        fake_cv2.VideoCapture.return_value.grab.assert_not_called()
+
+    def test_preview_starts_grabber(self, camera):
+        """
+        *****
+        Purpose: The first get_preview() call should start the grabber and
+        return an encoded frame
+
+        Parameters:
+        CameraClient camera: connected fixture client
+
+        Returns:
+        None
+        *****
+        """
+        assert camera.get_preview() == b"jpeg"
+        assert camera._grabber_thread is not None
+
+    def test_grabber_stops_when_idle(self, camera, monkeypatch):
+        """
+        *****
+        Purpose: The grabber should exit once no preview has been requested
+        for PREVIEW_IDLE_TIMEOUT
+
+        Parameters:
+        CameraClient camera: connected fixture client
+        monkeypatch monkeypatch: pytest monkeypatch fixture
+
+        Returns:
+        None
+        *****
+        """
+        monkeypatch.setattr(camera_client, "PREVIEW_IDLE_TIMEOUT", 0.05)
+        camera.get_preview()
+        deadline = time.monotonic() + 2.0
+        while camera._grabber_thread is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert camera._grabber_thread is None
+
+    def test_disabled_preview_keeps_grabber_off(self, camera):
+        """
+        *****
+        Purpose: While previews are disabled (auto-align), get_preview()
+        should return None without starting the grabber
+
+        Parameters:
+        CameraClient camera: connected fixture client
+
+        Returns:
+        None
+        *****
+        """
+        camera.get_preview()
+        camera.set_preview_enabled(False)
+        assert camera._grabber_thread is None
+        assert camera.get_preview() is None
+        assert camera._grabber_thread is None
+
+
+# ===========================================================================
+# TestDeviceDiscovery
+# ===========================================================================
+
+
+class TestDeviceDiscovery:
+    """
+    *****
+    Purpose: Verify V4L2 nodes are filtered on the VIDIOC_QUERYCAP
+    capability bits without opening them through OpenCV
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    *****
+    """
+
+    CAPTURE = camera_client.V4L2_CAP_VIDEO_CAPTURE
+    METADATA = 0x00800000  # V4L2_CAP_META_CAPTURE: a UVC camera's second node
+
+    @pytest.fixture
+    def fake_nodes(self, monkeypatch, tmp_path):
+        """
+        *****
+        Purpose: Fake /dev video nodes and the QUERYCAP ioctl
+
+        Each node maps to a (capabilities, device_caps) pair that the fake
+        ioctl packs into the struct v4l2_capability buffer.
+
+        Parameters:
+        monkeypatch monkeypatch: pytest monkeypatch fixture
+        pathlib.Path tmp_path: pytest fixture providing a unique temporary directory
+
+        Returns:
+        dict: node path -> (capabilities, device_caps), filled in by the test
+        *****
+        """
+        import fcntl
+        import os
+        import struct
+
+        nodes = {}
+        fd_paths = {}
+        real_open, real_scandir = os.open, os.scandir
+        stand_in = tmp_path / "node"
+        stand_in.write_bytes(b"")
+
+        class Entries(list):
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        def fake_scandir(path):
+            if path != '/dev':
+                return real_scandir(path)
+            names = [p.rsplit('/', 1)[1] for p in nodes] + ["video-index", "null"]
+            return Entries(SimpleNamespace(name=n) for n in names)
+
+        def fake_open(path, flags, *args):
+            if path not in nodes:
+                return real_open(path, flags, *args)
+            fd = real_open(stand_in, os.O_RDONLY)
+            fd_paths[fd] = path
+            return fd
+
+        def fake_ioctl(fd, request, buf):
+            assert request == camera_client.VIDIOC_QUERYCAP
+            struct.pack_into('=II', buf, 84, *nodes[fd_paths[fd]])
+            return 0
+
+        monkeypatch.setattr(os, "scandir", fake_scandir)
+        monkeypatch.setattr(os, "open", fake_open)
+        monkeypatch.setattr(fcntl, "ioctl", fake_ioctl)
+        monkeypatch.setattr(camera_client.sys, "platform", "linux")
+        return nodes
+
+    def test_capture_flag_in_capabilities(self, fake_nodes):
+        """
+        *****
+        Purpose: A node reporting V4L2_CAP_VIDEO_CAPTURE is a capture device;
+        one without it is not
+
+        Parameters:
+        dict fake_nodes: fake node capability table
+
+        Returns:
+        None
+        *****
+        """
+        fake_nodes["/dev/video0"] = (self.CAPTURE, 0)
+        fake_nodes["/dev/video1"] = (self.METADATA, 0)
+        assert camera_client._v4l2_is_capture_device("/dev/video0") is True
+        assert camera_client._v4l2_is_capture_device("/dev/video1") is False
+
+    def test_device_caps_take_precedence(self, fake_nodes):
+        """
+        *****
+        Purpose: With V4L2_CAP_DEVICE_CAPS set, the per-node device_caps
+        field decides, not the whole-device capabilities
+
+        Parameters:
+        dict fake_nodes: fake node capability table
+
+        Returns:
+        None
+        *****
+        """
+        device_caps = camera_client.V4L2_CAP_DEVICE_CAPS
+        fake_nodes["/dev/video0"] = (device_caps | self.CAPTURE | self.METADATA, self.CAPTURE)
+        fake_nodes["/dev/video1"] = (device_caps | self.CAPTURE | self.METADATA, self.METADATA)
+        assert camera_client._v4l2_is_capture_device("/dev/video0") is True
+        assert camera_client._v4l2_is_capture_device("/dev/video1") is False
+
+    def test_list_devices_filters_and_sorts_nodes(self, fake_nodes):
+        """
+        *****
+        Purpose: list_devices() should return only the capture-capable
+        videoN nodes, in numeric order, skipping other /dev entries
+
+        Parameters:
+        dict fake_nodes: fake node capability table
+
+        Returns:
+        None
+        *****
+        """
+        fake_nodes["/dev/video10"] = (self.CAPTURE, 0)
+        fake_nodes["/dev/video3"] = (self.METADATA, 0)
+        fake_nodes["/dev/video2"] = (self.CAPTURE, 0)
+        assert CameraClient().list_devices() == ["/dev/video2", "/dev/video10"]
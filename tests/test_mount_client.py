@@ -0,0 +1,552 @@
+"""
+*****
+Purpose: Unit tests for the mount_client module
+
+Covers the direct-serial command path of MountClient (response framing,
+input buffer handling, high-level position queries) against a mocked
+serial port, without touching real hardware.
+
+Parameters:
+None
+
+Returns:
+None
+*****
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from mount_client import MountClient
+
+
+@pytest.fixture
+def mount(mock_serial):
+    """
+    *****
+    Purpose: Provide a MountClient already "connected" in serial mode to the
+    mock serial port from conftest
+
+    Parameters:
+    unittest.mock.MagicMock mock_serial: the conftest mock serial port
+
+    Returns:
+    MountClient: a client whose serial_conn is the mock port
+    *****
+    """
+    mock_serial.in_waiting = 0
+    client = MountClient()
+    client.serial_conn = mock_serial
+    client.mode = 'serial'
+    client._connected = True
+    return client
+
+
+# ===========================================================================
+# TestSerialCommand
+# ===========================================================================
+
+
+class TestSerialCommand:
+    """
+    *****
+    Purpose: Verify _serial_command reads one #-terminated response per
+    command and only flushes the input buffer after a failed read
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    *****
+    """
+
+    def test_response_terminator_is_stripped(self, mount):
+        """
+        *****
+        Purpose: A ":GR#" query should return the RA string without the
+        trailing "#" terminator
+
+        Parameters:
+        MountClient mount: fixture client on the mock serial port
+
+        Returns:
+        None
+        *****
+        """
+        assert mount.send_command(":GR#") == "06:30:00"
+
+    def test_get_position_returns_ra_and_dec(self, mount):
+        """
+        *****
+        Purpose: get_position() should return the RA and DEC strings reported
+        by the mount
+
+        Parameters:
+        MountClient mount: fixture client on the mock serial port
+
+        Returns:
+        None
+        *****
+        """
+        assert mount.get_position() == ("06:30:00", "+45*00:00")
+
+    def test_no_flush_on_clean_reads(self, mount, mock_serial):
+        """
+        *****
+        Purpose: Successive well-framed responses should never trigger a
+        reset_input_buffer() call
+
+        Parameters:
+        MountClient mount: fixture client on the mock serial port
+        unittest.mock.MagicMock mock_serial: the conftest mock serial port
+
+        Returns:
+        None
+        *****
+        """
+        mount.send_command(":GR#")
+        mount.send_command(":GD#")
+        mock_serial.reset_input_buffer.assert_not_called()
+
+    def test_flush_after_timed_out_read(self, mount, mock_serial):
+        """
+        *****
+        Purpose: A response missing its "#" terminator (read timeout) should
+        cause the next command to flush the input buffer first
+
+        Parameters:
+        MountClient mount: fixture client on the mock serial port
+        unittest.mock.MagicMock mock_serial: the conftest mock serial port
+
+        Returns:
+        None
+        *****
+        """
+        mount.send_command(":GVN#")  # mock answers b"1" with no terminator
+        mock_serial.reset_input_buffer.assert_not_called()
+        mount.send_command(":GR#")
+        mock_serial.reset_input_buffer.assert_called_once()
+
+    def test_flush_when_stray_bytes_waiting(self, mount, mock_serial):
+        """
+        *****
+        Purpose: Bytes already sitting in the input buffer before a command
+        is written should be flushed so they are not read as its reply
+
+        Parameters:
+        MountClient mount: fixture client on the mock serial port
+        unittest.mock.MagicMock mock_serial: the conftest mock serial port
+
+        Returns:
+        None
+        *****
+        """
+        mock_serial.in_waiting = 3
+        mount.send_command(":GR#")
+        mock_serial.reset_input_buffer.assert_called_once()
+
+
+
+    def test_motion_command_is_write_only(self, mount, mock_serial):
+        """
+        *****
+        Purpose: Fire-and-forget move commands should only write the bytes,
+        without flushing or waiting for a reply
+
+        Parameters:
+        MountClient mount: fixture client on the mock serial port
+        unittest.mock.MagicMock mock_serial: the conftest mock serial port
+
+        Returns:
+        None
+        *****
+        """
+        mock_serial.in_waiting = 3
+        mount.move_azimuth(1.5)
+        mock_serial.write.assert_called_once_with(b":MAZ+1.50#")
+        mock_serial.reset_input_buffer.assert_not_called()
+        mock_serial.read_until.assert_not_called()
+
+# ===========================================================================
+# TestChunkedRead
+# ===========================================================================
+
+
+@pytest.mark.skipif(os.name != "posix", reason="chunked fd reads are POSIX only")
+class TestChunkedRead:
+    """
+    *****
+    Purpose: Verify the POSIX fast path that reads replies from the raw fd
+    in chunks, using a pipe in place of the serial device
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    *****
+    """
+
+    @pytest.fixture
+    def pipe_mount(self, mount, mock_serial):
+        """
+        *****
+        Purpose: Point the mount's raw reply fd at the read end of a pipe
+
+        Parameters:
+        MountClient mount: fixture client on the mock serial port
+        unittest.mock.MagicMock mock_serial: the conftest mock serial port
+
+        Returns:
+        tuple: (MountClient, write-end fd of the pipe)
+        *****
+        """
+        read_fd, write_fd = os.pipe()
+        mock_serial.timeout = 0.05
+        mount._rx_fd = read_fd
+        yield mount, write_fd
+        os.close(read_fd)
+        os.close(write_fd)
+
+    def test_reply_read_from_fd(self, pipe_mount, mock_serial):
+        """
+        *****
+        Purpose: A #-terminated reply on the fd should be returned without
+        the terminator and without using pyserial's read_until
+
+        Parameters:
+        tuple pipe_mount: (MountClient, pipe write fd)
+        unittest.mock.MagicMock mock_serial: the conftest mock serial port
+
+        Returns:
+        None
+        *****
+        """
+        mount, write_fd = pipe_mount
+        os.write(write_fd, b"06:30:00#")
+        assert mount.send_command(":GR#") == "06:30:00"
+        mock_serial.read_until.assert_not_called()
+
+    def test_trailing_bytes_flushed_before_next_command(self, pipe_mount, mock_serial):
+        """
+        *****
+        Purpose: Bytes left over after the terminator should be discarded
+        before the next command rather than read as its reply
+
+        Parameters:
+        tuple pipe_mount: (MountClient, pipe write fd)
+        unittest.mock.MagicMock mock_serial: the conftest mock serial port
+
+        Returns:
+        None
+        *****
+        """
+        mount, write_fd = pipe_mount
+        os.write(write_fd, b"06:30:00#stale#")
+        mount.send_command(":GR#")
+        os.write(write_fd, b"+45*00:00#")
+        assert mount.send_command(":GD#") == "+45*00:00"
+        mock_serial.reset_input_buffer.assert_called_once()
+
+    def test_timeout_returns_partial_reply(self, pipe_mount):
+        """
+        *****
+        Purpose: An unterminated reply should be returned once the port
+        timeout expires instead of blocking forever
+
+        Parameters:
+        tuple pipe_mount: (MountClient, pipe write fd)
+
+        Returns:
+        None
+        *****
+        """
+        mount, write_fd = pipe_mount
+        os.write(write_fd, b"1")
+        assert mount.send_command(":MT1#") == "1"
+        assert mount._rx_dirty is True
+
+# ===========================================================================
+# TestStatusPosition
+# ===========================================================================
+
+
+class TestStatusPosition:
+    """
+    *****
+    Purpose: Verify get_position() reads RA/DEC from a single :GX# status
+    reply and falls back to :GR#/:GD# when the reply cannot be parsed
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    *****
+    """
+
+    def test_position_from_status_string(self, mount, mock_serial):
+        """
+        *****
+        Purpose: A well-formed :GX# reply should yield RA/DEC in the same
+        format as :GR#/:GD# using only one serial command
+
+        Parameters:
+        MountClient mount: fixture client on the mock serial port
+        unittest.mock.MagicMock mock_serial: the conftest mock serial port
+
+        Returns:
+        None
+        *****
+        """
+        mock_serial.read_until.side_effect = None
+        mock_serial.read_until.return_value = b"Tracking,--T--,11219,-3298,11302,063000,+450000,#"
+
+        assert mount.get_position() == ("06:30:00", "+45*00:00")
+        assert mock_serial.write.call_count == 1
+
+    def test_unparseable_status_falls_back(self, mount, mock_serial):
+        """
+        *****
+        Purpose: When :GX# does not carry coordinates, get_position() should
+        query :GR# and :GD# individually
+
+        Parameters:
+        MountClient mount: fixture client on the mock serial port
+        unittest.mock.MagicMock mock_serial: the conftest mock serial port
+
+        Returns:
+        None
+        *****
+        """
+        assert mount.get_position() == ("06:30:00", "+45*00:00")
+        sent = [c[0][0] for c in mock_serial.write.call_args_list]
+        assert sent[-2:] == [b":GR#", b":GD#"]
+
+
+# ===========================================================================
+# TestStatusCache
+# ===========================================================================
+
+
+class TestStatusCache:
+    """
+    *****
+    Purpose: Verify the short-lived :GX# cache lets several state queries
+    share one serial round-trip and is dropped when the mount is moved
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    *****
+    """
+
+    STATUS = b"Tracking,--T-A,11219,-3298,11302,063000,+450000,#"
+
+    def test_state_queries_share_one_status_read(self, mount, mock_serial):
+        """
+        *****
+        Purpose: is_slewing/is_tracking/is_adjusting/get_position called
+        back-to-back should issue a single :GX# command
+
+        Parameters:
+        MountClient mount: fixture client on the mock serial port
+        unittest.mock.MagicMock mock_serial: the conftest mock serial port
+
+        Returns:
+        None
+        *****
+        """
+        mock_serial.read_until.side_effect = None
+        mock_serial.read_until.return_value = self.STATUS
+
+        assert mount.is_slewing() is False
+        assert mount.is_tracking() is True
+        assert mount.is_adjusting() is True
+        assert mount.get_position() == ("06:30:00", "+45*00:00")
+        assert mock_serial.write.call_count == 1
+
+    def test_motion_command_invalidates_cache(self, mount, mock_serial):
+        """
+        *****
+        Purpose: Sending a move command should force the next status query
+        to go back to the mount
+
+        Parameters:
+        MountClient mount: fixture client on the mock serial port
+        unittest.mock.MagicMock mock_serial: the conftest mock serial port
+
+        Returns:
+        None
+        *****
+        """
+        mock_serial.read_until.side_effect = None
+        mock_serial.read_until.return_value = self.STATUS
+
+        mount.get_status()
+        mount.move_azimuth(1.0)
+        mount.get_status()
+        sent = [c[0][0] for c in mock_serial.write.call_args_list]
+        assert sent.count(b":GX#") == 2
+
+    def test_move_during_status_read_invalidates_cache(self, mount, mock_serial):
+        """
+        *****
+        Purpose: A move sent while a :GX# query is waiting for its reply must
+        not let that pre-move reply be cached afterwards
+
+        Parameters:
+        MountClient mount: fixture client on the mock serial port
+        unittest.mock.MagicMock mock_serial: the conftest mock serial port
+
+        Returns:
+        None
+        *****
+        """
+        reading = threading.Event()
+        release = threading.Event()
+
+        def slow_read(terminator):
+            reading.set()
+            release.wait(1.0)
+            return self.STATUS
+
+        mock_serial.read_until.side_effect = slow_read
+        poller = threading.Thread(target=mount.get_status)
+        poller.start()
+        assert reading.wait(1.0)
+
+        mover = threading.Thread(target=mount.move_azimuth, args=(1.0,))
+        mover.start()
+        time.sleep(0.02)  # let the move reach the serial lock
+        release.set()
+        poller.join(1.0)
+        mover.join(1.0)
+
+        mock_serial.read_until.side_effect = None
+        mock_serial.read_until.return_value = self.STATUS
+        mount.get_status()
+        sent = [c[0][0] for c in mock_serial.write.call_args_list]
+        assert sent == [b":GX#", b":MAZ+1.00#", b":GX#"]
+
+
+# ===========================================================================
+# TestAzAltPosition
+# ===========================================================================
+
+
+class TestAzAltPosition:
+    """
+    *****
+    Purpose: Verify get_az_alt_position() parses the :XGAA# "AZ|ALT|..." reply
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    *****
+    """
+
+    @pytest.mark.parametrize("reply, expected", [
+        (b"1200|-340#", (1200, -340)),
+        (b"1200|-340|0#", (1200, -340)),
+        (b"1200#", (None, None)),
+        (b"12|abc#", (None, None)),
+    ])
+    def test_parse_reply(self, mount, mock_serial, reply, expected):
+        """
+        *****
+        Purpose: Stepper positions should be read from the first two fields,
+        and malformed replies should give (None, None)
+
+        Parameters:
+        MountClient mount: fixture client on the mock serial port
+        unittest.mock.MagicMock mock_serial: the conftest mock serial port
+        bytes reply: raw :XGAA# reply returned by the mock port
+        tuple expected: the expected (AZ, ALT) result
+
+        Returns:
+        None
+        *****
+        """
+        mock_serial.read_until.side_effect = None
+        mock_serial.read_until.return_value = reply
+        assert mount.get_az_alt_position() == expected
+
+
+# ===========================================================================
+# TestWaitUntilIdle
+# ===========================================================================
+
+
+class TestWaitUntilIdle:
+    """
+    *****
+    Purpose: Verify wait_until_idle() polls :GX# with backoff until the AZ/ALT
+    motors stop, and gives up at the deadline
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    *****
+    """
+
+    ADJUSTING = b"Tracking,--T-A,11219,-3298,11302,063000,+450000,#"
+    IDLE = b"Tracking,--T--,11219,-3298,11302,063000,+450000,#"
+
+    def test_returns_true_once_idle(self, mount, mock_serial):
+        """
+        *****
+        Purpose: A mount that reports adjusting for three polls and then idle
+        should make wait_until_idle() return True after the fourth poll
+
+        Parameters:
+        MountClient mount: fixture client on the mock serial port
+        unittest.mock.MagicMock mock_serial: the conftest mock serial port
+
+        Returns:
+        None
+        *****
+        """
+        mount._status_ttl = 0  # every poll goes to the mount
+        mock_serial.read_until.side_effect = [self.ADJUSTING] * 3 + [self.IDLE]
+
+        assert mount.wait_until_idle(timeout=2.0) is True
+        sent = [c[0][0] for c in mock_serial.write.call_args_list]
+        assert sent == [b":GX#"] * 4
+
+    def test_returns_false_at_deadline(self, mount, mock_serial):
+        """
+        *****
+        Purpose: A mount that never goes idle should make wait_until_idle()
+        return False once the timeout expires, with the backoff keeping the
+        number of polls small
+
+        Parameters:
+        MountClient mount: fixture client on the mock serial port
+        unittest.mock.MagicMock mock_serial: the conftest mock serial port
+
+        Returns:
+        None
+        *****
+        """
+        mount._status_ttl = 0
+        mock_serial.read_until.side_effect = None
+        mock_serial.read_until.return_value = self.ADJUSTING
+
+        start = time.monotonic()
+        assert mount.wait_until_idle(timeout=0.3) is False
+        elapsed = time.monotonic() - start
+
+        assert 0.3 <= elapsed < 1.0
+        # 10, 20, 40, 80, 150 (remaining) ms sleeps: about six polls, not 30
+        assert mock_serial.write.call_count <= 8
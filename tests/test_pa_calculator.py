@@ -22,6 +22,7 @@ from pa_calculator import (
     PAError,
     calculate_correction,
     calculate_pa_error,
+    calculate_pa_error_batch,
     estimate_iterations,
     parse_dec_string,
     parse_ra_string,
@@ -199,6 +200,27 @@ class TestParseRaString:
         result = parse_ra_string("")
         assert result is None
 
+    @pytest.mark.parametrize("ra_str, expected", [
+        ("+06:30:00", 97.5),
+        ("-1:00:00", -15.0),
+        ("06: 30:00", 97.5),
+    ])
+    def test_signed_and_spaced_forms_still_parse(self, ra_str, expected):
+        """
+        *****
+        Purpose: Signed hours and spaced fields, accepted by the original
+        split-based parser, should still parse
+
+        Parameters:
+        str ra_str: the RA string to parse
+        float expected: the expected RA in degrees
+
+        Returns:
+        None
+        *****
+        """
+        assert_close(parse_ra_string(ra_str), expected)
+
 
 # ===========================================================================
 # TestParseDecString
@@ -338,6 +360,27 @@ class TestParseDecString:
         result = parse_dec_string("not-valid")
         assert result is None
 
+    @pytest.mark.parametrize("dec_str, expected", [
+        ("+45:30:15:00", 45.504167),
+        ("-45*30:15:00", -45.504167),
+        ("+45* 30", 45.5),
+    ])
+    def test_extra_fields_and_spacing_still_parse(self, dec_str, expected):
+        """
+        *****
+        Purpose: Extra trailing fields and spaced fields, accepted by the
+        original split-based parser, should still parse (extra fields ignored)
+
+        Parameters:
+        str dec_str: the DEC string to parse
+        float expected: the expected DEC in degrees
+
+        Returns:
+        None
+        *****
+        """
+        assert_close(parse_dec_string(dec_str), expected)
+
 
 # ===========================================================================
 # TestCalculatePaError
@@ -497,6 +540,64 @@ class TestCalculatePaError:
         assert_close(result.total_error, expected_total, tolerance=0.1)
 
 
+# ===========================================================================
+# TestCalculatePaErrorBatch
+# ===========================================================================
+
+
+class TestCalculatePaErrorBatch:
+    """
+    *****
+    Purpose: Verify the vectorised batch PA error agrees with the scalar
+    calculation and averages across samples
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    *****
+    """
+
+    def test_single_sample_matches_scalar(self):
+        """
+        *****
+        Purpose: A one-element batch should give the same result as
+        calculate_pa_error, including RA wrapping across 0/360
+
+        Parameters:
+        None
+
+        Returns:
+        None
+        *****
+        """
+        scalar = calculate_pa_error(359.5, 46.0, 0.5, 45.0, latitude=40.0)
+        batch = calculate_pa_error_batch([359.5], [46.0], 0.5, 45.0, latitude=40.0)
+        assert_close(batch.az_error, scalar.az_error)
+        assert_close(batch.alt_error, scalar.alt_error)
+        assert_close(batch.total_error, scalar.total_error, tolerance=0.1)
+
+    def test_batch_is_mean_of_samples(self):
+        """
+        *****
+        Purpose: Symmetric DEC offsets around the mount position should
+        average to zero altitude error
+
+        Parameters:
+        None
+
+        Returns:
+        None
+        *****
+        """
+        result = calculate_pa_error_batch(
+            [90.0, 90.0], [46.0, 44.0], [90.0, 90.0], [45.0, 45.0], latitude=40.0
+        )
+        assert_close(result.alt_error, 0.0)
+        assert_close(result.az_error, 0.0)
+
+
 # ===========================================================================
 # TestPAError
 # ===========================================================================
@@ -745,6 +846,22 @@ class TestEstimateIterations:
         result = estimate_iterations(1e12, target_accuracy=1.0)
         assert result == 20
 
+    @pytest.mark.parametrize("error", [math.inf, math.nan])
+    def test_non_finite_error_returns_cap(self, error):
+        """
+        *****
+        Purpose: An infinite or NaN error should return the 20-iteration cap
+        instead of raising from the logarithm
+
+        Parameters:
+        float error: the non-finite current error
+
+        Returns:
+        None
+        *****
+        """
+        assert estimate_iterations(error, target_accuracy=60.0) == 20
+
     def test_exact_target_returns_zero(self):
         """
         *****
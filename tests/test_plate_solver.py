@@ -14,9 +14,13 @@ None
 *****
 """
 
+import math
+import os
+from unittest.mock import patch
+
 import pytest
 
-from plate_solver import PlateSolver, SolveResult
+from plate_solver import PlateSolver, SolveResult, _tan_center
 
 
 # ---------------------------------------------------------------------------
@@ -189,6 +193,22 @@ class TestSolveResult:
         result = make_solve_result(ra=97.5)
         assert result.ra_hms() == "06:30:00.00"
 
+    def test_ra_hms_rounding_carries_into_minutes(self):
+        """
+        *****
+        Purpose: Seconds that round up to 60.00 should carry into the
+        minutes field ("06:31:00.00", never "06:30:60.00")
+
+        Parameters:
+        None
+
+        Returns:
+        None
+        *****
+        """
+        result = make_solve_result(ra=(6 * 3600 + 30 * 60 + 59.999) / 240)
+        assert result.ra_hms() == "06:31:00.00"
+
     # -----------------------------------------------------------------------
     # dec_dms
     # -----------------------------------------------------------------------
@@ -402,3 +422,420 @@ class TestPlateSolverDispatch:
         solver.solver = "unknown_solver"  # bypass set_solver validation
         result = solver.solve(str(dummy_image))
         assert result is None
+
+
+# ===========================================================================
+# TestSolverHints
+# ===========================================================================
+
+
+class TestSolverHints:
+    """
+    *****
+    Purpose: Verify position and scale hints are forwarded to the solver
+    command line without running a real solver
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    *****
+    """
+
+    def test_astrometry_scale_and_position_hints(self, tmp_path):
+        """
+        *****
+        Purpose: solve() with ra/dec/scale hints should pass arcsec-per-pixel
+        scale bounds and the configured search radius to solve-field
+
+        Parameters:
+        tmp_path tmp_path: pytest fixture providing a unique temporary directory
+
+        Returns:
+        None
+        *****
+        """
+        dummy_image = tmp_path / "test.png"
+        dummy_image.write_text("dummy")
+
+        solver = PlateSolver()
+        solver.set_solver("astrometry")
+        with patch("plate_solver.subprocess.run") as run:
+            run.return_value.stderr = b""
+            solver.solve(str(dummy_image), ra_hint=10.0, dec_hint=85.0, scale_hint=2.0)
+
+        cmd = run.call_args[0][0]
+        assert cmd[cmd.index("--scale-units") + 1] == "arcsecperpix"
+        assert float(cmd[cmd.index("--scale-low") + 1]) < 2.0 < float(cmd[cmd.index("--scale-high") + 1])
+        assert cmd[cmd.index("--ra") + 1] == "10.0"
+        assert cmd[cmd.index("--radius") + 1] == "30"
+        assert cmd[cmd.index("--cpulimit") + 1] == "5"  # SOLVER_TIMEOUT (10) minus margin
+
+    def test_astrometry_skips_unused_outputs(self, tmp_path):
+        """
+        *****
+        Purpose: solve-field should be told not to write the outputs that are
+        never parsed, while still producing the .solved and .wcs sidecars
+
+        Parameters:
+        tmp_path tmp_path: pytest fixture providing a unique temporary directory
+
+        Returns:
+        None
+        *****
+        """
+        dummy_image = tmp_path / "test.png"
+        dummy_image.write_text("dummy")
+
+        solver = PlateSolver()
+        solver.set_solver("astrometry")
+        with patch("plate_solver.subprocess.run") as run:
+            run.return_value.stderr = b""
+            solver.solve(str(dummy_image))
+
+        cmd = run.call_args[0][0]
+        for flag in ("--new-fits", "--match", "--rdls", "--corr", "--index-xyls"):
+            assert cmd[cmd.index(flag) + 1] == "none"
+        assert "--solved" not in cmd
+        assert "--wcs" not in cmd
+
+
+# ===========================================================================
+# TestSolveBatch
+# ===========================================================================
+
+
+class TestSolveBatch:
+    """
+    *****
+    Purpose: Verify solve_batch() solves each distinct image once and
+    returns results keyed by path in input order
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    *****
+    """
+
+    def test_results_keyed_in_input_order(self):
+        """
+        *****
+        Purpose: solve_batch() should call solve() once per distinct path
+        with the shared hints and map each path to its result
+
+        Parameters:
+        None
+
+        Returns:
+        None
+        *****
+        """
+        solver = PlateSolver()
+        paths = ["/tmp/b.png", "/tmp/a.png", "/tmp/b.png", "/tmp/c.png"]
+
+        def fake_solve(path, **hints):
+            assert hints["ra_hint"] == 10.0
+            return None if path == "/tmp/c.png" else make_solve_result(ra=len(path))
+
+        with patch.object(solver, "solve", side_effect=fake_solve) as solve:
+            results = solver.solve_batch(paths, ra_hint=10.0, dec_hint=85.0)
+
+        assert list(results) == ["/tmp/b.png", "/tmp/a.png", "/tmp/c.png"]
+        assert solve.call_count == 3
+        assert results["/tmp/a.png"].ra == len("/tmp/a.png")
+        assert results["/tmp/c.png"] is None
+
+    def test_empty_batch(self):
+        """
+        *****
+        Purpose: An empty list of paths should return an empty dict
+
+        Parameters:
+        None
+
+        Returns:
+        None
+        *****
+        """
+        assert PlateSolver().solve_batch([]) == {}
+
+    def test_table_columns_and_to_list(self):
+        """
+        *****
+        Purpose: solve_batch_table() should fill one array row per distinct
+        path, leave failed rows as NaN, and round-trip through to_list()
+
+        Parameters:
+        None
+
+        Returns:
+        None
+        *****
+        """
+        solver = PlateSolver()
+        paths = ["/tmp/a.png", "/tmp/b.png", "/tmp/a.png"]
+
+        def fake_solve(path, **hints):
+            return None if path == "/tmp/b.png" else make_solve_result(ra=120.0, dec=89.5)
+
+        with patch.object(solver, "solve", side_effect=fake_solve):
+            table = solver.solve_batch_table(paths)
+
+        assert len(table) == 2
+        assert table.solved.tolist() == [True, False]
+        assert table.ra[0] == 120.0
+        assert math.isnan(table.dec[1])
+
+        results = table.to_list()
+        assert results[1] is None
+        assert results[0].dec == 89.5
+        assert results[0].source_path == "/tmp/a.png"
+        assert results[0].ra_hms() == "08:00:00.00"
+
+
+# ===========================================================================
+# TestTanCenter
+# ===========================================================================
+
+
+def make_tan_header(**overrides):
+    """
+    *****
+    Purpose: Build a minimal TAN WCS header (as a dict) with a 1 arcsec/px
+    north-up CD matrix, allowing callers to override any keyword
+
+    Parameters:
+    dict overrides: keyword arguments that override the default header keys
+
+    Returns:
+    dict: header mapping usable by _tan_center
+    *****
+    """
+    header = {
+        "CTYPE1": "RA---TAN", "CTYPE2": "DEC--TAN",
+        "CRVAL1": 120.0, "CRVAL2": 45.0,
+        "CRPIX1": 961.0, "CRPIX2": 541.0,
+        "CD1_1": -1 / 3600, "CD1_2": 0.0, "CD2_1": 0.0, "CD2_2": 1 / 3600,
+    }
+    header.update(overrides)
+    return header
+
+
+class TestTanCenter:
+    """
+    *****
+    Purpose: Verify the closed-form TAN pixel-to-sky conversion used in
+    place of astropy WCS for plain solver headers
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    *****
+    """
+
+    def test_reference_pixel_maps_to_crval(self):
+        """
+        *****
+        Purpose: The image centre at CRPIX (1-based 961, 541 for a 1920x1080
+        frame) should map exactly to CRVAL1/CRVAL2
+
+        Parameters:
+        None
+
+        Returns:
+        None
+        *****
+        """
+        ra, dec = _tan_center(make_tan_header(), 1920 / 2, 1080 / 2)
+        assert_close(ra, 120.0)
+        assert_close(dec, 45.0)
+
+    def test_offset_along_dec_axis(self):
+        """
+        *****
+        Purpose: 3600 pixels "up" at 1 arcsec/px from the equator should be
+        1 degree north (atan of the tangent-plane offset)
+
+        Parameters:
+        None
+
+        Returns:
+        None
+        *****
+        """
+        header = make_tan_header(CRVAL2=0.0, CRPIX1=1.0, CRPIX2=1.0)
+        ra, dec = _tan_center(header, 0.0, 3600.0)
+        assert_close(dec, math.degrees(math.atan(math.radians(1.0))))
+        assert_close(ra, 120.0)
+
+    def test_ra_wraps_into_range(self):
+        """
+        *****
+        Purpose: A centre just west of RA 0 should be reported near 360,
+        not as a negative RA
+
+        Parameters:
+        None
+
+        Returns:
+        None
+        *****
+        """
+        header = make_tan_header(CRVAL1=0.0, CRVAL2=0.0, CRPIX1=1.0)
+        ra, _ = _tan_center(header, 36.0, 540.0)
+        assert 359.0 < ra < 360.0
+
+    def test_sip_header_not_handled(self):
+        """
+        *****
+        Purpose: Headers with SIP distortion should return None so the
+        caller falls back to astropy WCS
+
+        Parameters:
+        None
+
+        Returns:
+        None
+        *****
+        """
+        assert _tan_center(make_tan_header(A_ORDER=2), 960, 540) is None
+        assert _tan_center(make_tan_header(CTYPE1="RA---TAN-SIP"), 960, 540) is None
+
+
+# ===========================================================================
+# TestAstapIniParsing
+# ===========================================================================
+
+
+class TestAstapIniParsing:
+    """
+    *****
+    Purpose: Verify the ASTAP .ini result is parsed into the basic
+    (astropy-free) SolveResult
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    *****
+    """
+
+    def test_crval_read_from_ini(self, tmp_path):
+        """
+        *****
+        Purpose: CRVAL1/CRVAL2 should be read from the .ini regardless of
+        CRLF line endings or spaces around "="
+
+        Parameters:
+        tmp_path tmp_path: pytest fixture providing a unique temporary directory
+
+        Returns:
+        None
+        *****
+        """
+        ini_path = tmp_path / "capture.ini"
+        ini_path.write_bytes(b"PLTSOLVD=T\r\nCRVAL1 = 37.95\r\nCRVAL2=89.26 \r\nWARNING=\r\n")
+
+        with patch("plate_solver.ASTROPY_AVAILABLE", False):
+            result = PlateSolver()._parse_astap_result(tmp_path / "capture.wcs", ini_path)
+
+        assert_close(result.ra, 37.95)
+        assert_close(result.dec, 89.26)
+        assert result.solver == "astap"
+
+
+# ===========================================================================
+# TestSidecarReuse
+# ===========================================================================
+
+
+class TestSidecarReuse:
+    """
+    *****
+    Purpose: Verify solve() parses a solution already sitting next to the
+    image instead of running the solver, but only when it is fresh
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    *****
+    """
+
+    def _write_solved_image(self, tmp_path, wcs_offset_ns):
+        """
+        *****
+        Purpose: Create an image with ASTAP .wcs/.ini sidecars whose mtime is
+        offset from the image's mtime
+
+        Parameters:
+        tmp_path tmp_path: pytest fixture providing a unique temporary directory
+        int wcs_offset_ns: sidecar mtime minus image mtime, in nanoseconds
+
+        Returns:
+        pathlib.Path: path of the image
+        *****
+        """
+        image = tmp_path / "capture.png"
+        image.write_bytes(b"png")
+        (tmp_path / "capture.ini").write_text("CRVAL1=37.95\nCRVAL2=89.26\n")
+        wcs = tmp_path / "capture.wcs"
+        wcs.write_bytes(b"")
+
+        base_ns = 1_700_000_000_000_000_000
+        os.utime(image, ns=(base_ns, base_ns))
+        os.utime(wcs, ns=(base_ns + wcs_offset_ns, base_ns + wcs_offset_ns))
+        return image
+
+    def test_fresh_sidecar_skips_solver(self, tmp_path):
+        """
+        *****
+        Purpose: A .wcs newer than the image should be parsed directly and
+        the solver subprocess never started
+
+        Parameters:
+        tmp_path tmp_path: pytest fixture providing a unique temporary directory
+
+        Returns:
+        None
+        *****
+        """
+        image = self._write_solved_image(tmp_path, wcs_offset_ns=1_000_000)
+
+        with patch("plate_solver.ASTROPY_AVAILABLE", False), \
+             patch("plate_solver.subprocess.run") as run:
+            result = PlateSolver().solve(str(image))
+
+        run.assert_not_called()
+        assert_close(result.ra, 37.95)
+        assert result.source_path == str(image)
+
+    def test_stale_sidecar_runs_solver(self, tmp_path):
+        """
+        *****
+        Purpose: A .wcs older than the image belongs to a previous frame and
+        must not be reused
+
+        Parameters:
+        tmp_path tmp_path: pytest fixture providing a unique temporary directory
+
+        Returns:
+        None
+        *****
+        """
+        image = self._write_solved_image(tmp_path, wcs_offset_ns=-1_000_000)
+
+        with patch("plate_solver.ASTROPY_AVAILABLE", False), \
+             patch("plate_solver.subprocess.run") as run:
+            run.return_value.returncode = 1
+            run.return_value.stderr = b""
+            PlateSolver().solve(str(image))
+
+        run.assert_called_once()